@@ -7,21 +7,43 @@ Handles everything from CSV input to final translations without manual intervent
 import os
 import sys
 import time
+import random
 import json
 import csv
+import mmap
 import re
 import tiktoken
+import orjson
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (OpenAI, APIConnectionError, DefaultHttpxClient,
+                    InternalServerError, RateLimitError)
+from batch_tracking import (add_batch_record, initialize_batch_tracking,
+                            update_batch_status)
+
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
 
-# Initialize OpenAI client
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# Initialize OpenAI client. The SDK's default HTTP client already pools
+# keep-alive connections; HTTP/2 additionally multiplexes the concurrent
+# direct requests and status polls over one connection.
+client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"),
+                http_client=DefaultHttpxClient(http2=HTTP2_AVAILABLE))
+# Direct requests retry transient errors themselves (DIRECT_MAX_ATTEMPTS), so
+# they go through a copy of the client that does not retry on top of that
+direct_client = client.with_options(max_retries=0)
 if not os.getenv("OPENAI_API_KEY"):
     raise RuntimeError(
         "Set your OPENAI_API_KEY environment variable before running.")
@@ -30,8 +52,27 @@ if not os.getenv("OPENAI_API_KEY"):
 MODEL_NAME = "gpt-4o"
 MODEL_TOKEN_LIMIT = 4000  # Reduced from 16000 for smaller batches
 EXPECTED_OUTPUT_FACTOR = 1.8  # Increased to account for tuple format
-POLL_INTERVAL = 300  # 5 minutes
-BATCH_TRACKING_FILE = "batch_job_tracking.csv"
+POLL_INITIAL_INTERVAL = 5  # First status check after 5 seconds
+POLL_INTERVAL = 300  # Backoff cap: 5 minutes
+POLL_BACKOFF_FACTOR = 2
+POLL_JITTER = 0.1  # Up to 10% random extra delay per wait
+TERMINAL_JOB_STATUSES = ("completed", "failed", "cancelled", "expired")
+POLL_MAX_ATTEMPTS = 3  # Consecutive failed status checks before giving up
+DIRECT_MAX_BATCHES = 10  # Smaller inputs skip the Batch API queue
+DIRECT_MAX_WORKERS = 8  # Concurrent chat completion requests in direct mode
+DIRECT_MAX_ATTEMPTS = 4  # Tries per direct request on transient errors
+TRANSIENT_API_ERRORS = (APIConnectionError, InternalServerError,
+                        RateLimitError)
+MAX_CONCURRENT_JOBS = 4  # Languages prepared/processed at once in multi-language mode
+CSV_READ_BUFFER_SIZE = 1 << 20  # Read the input CSV 1 MB at a time
+CSV_WRITE_BUFFER_SIZE = 1 << 20  # Buffer for the final CSV and missing log
+JSONL_WRITE_BUFFER_SIZE = 4 << 20  # Coalesce batch request writes into 4 MB
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # Stream downloads to disk 1 MB at a time
+PARALLEL_PARSE_MIN_BYTES = 64 << 20  # Parse larger output files in processes
+PARALLEL_SPLIT_MIN_CHARS = 8 << 20  # Split larger reply sets in processes
+PARSE_MAX_WORKERS = 8  # Processes splitting batch replies into translations
+ANALYZE_CHUNK_BYTES = 16 << 20  # Byte range per analyzer worker task
+LINE_COUNT_SLICE_BYTES = 1 << 20  # Count analyzer chunk lines 1 MB at a time
 
 # Auto-repair Configuration
 AUTO_REPAIR_ENABLED = True
@@ -40,8 +81,12 @@ REPAIR_CONFIDENCE_THRESHOLD = 0.8
 BACKUP_FAILED_BATCHES = True
 
 
-def setup_logging(log_filename=None):
-    """Set up logging to both console and file with timestamps."""
+def setup_logging(log_filename=None, thread_names=False):
+    """Set up logging to both console and file with timestamps.
+
+    With thread_names=True each line is tagged with the worker thread name,
+    which multi-language runs set to the target language.
+    """
     if log_filename is None:
         timestamp = int(time.time())
         log_filename = f"translation_log_{timestamp}.txt"
@@ -53,7 +98,10 @@ def setup_logging(log_filename=None):
     log_path = log_dir / log_filename
 
     # Configure logging format
-    log_format = '%(asctime)s - %(levelname)s - %(message)s'
+    if thread_names:
+        log_format = '%(asctime)s - %(levelname)s - [%(threadName)s] %(message)s'
+    else:
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
     date_format = '%Y-%m-%d %H:%M:%S'
 
     # Remove any existing handlers
@@ -72,170 +120,28 @@ def setup_logging(log_filename=None):
     return str(log_path)
 
 
-class DualLogger:
-    """Custom logger that prints to both console and log file."""
-
-    def __init__(self, log_path):
-        self.log_path = log_path
-        self.logger = logging.getLogger(__name__)
-
-    def log(self, message, level="INFO"):
-        """Log message at specified level."""
-        if level == "INFO":
-            self.logger.info(message)
-        elif level == "ERROR":
-            self.logger.error(message)
-        elif level == "WARNING":
-            self.logger.warning(message)
-        elif level == "DEBUG":
-            self.logger.debug(message)
-
-    def info(self, message):
-        """Log info message."""
-        self.log(message, "INFO")
-
-    def error(self, message):
-        """Log error message."""
-        self.log(message, "ERROR")
+class _BufferingHandler(logging.Handler):
+    """Keeps (level, message) pairs in a worker process for the parent to replay."""
 
-    def warning(self, message):
-        """Log warning message."""
-        self.log(message, "WARNING")
+    def __init__(self):
+        super().__init__()
+        self.records = []
 
-    def debug(self, message):
-        """Log debug message."""
-        self.log(message, "DEBUG")
+    def emit(self, record):
+        self.records.append((record.levelno, record.getMessage()))
 
 
-# Global logger instance
-logger = None
-
-
-def initialize_batch_tracking():
-    """Initialize the batch tracking CSV file if it doesn't exist."""
-    if not Path(BATCH_TRACKING_FILE).exists():
-        with open(BATCH_TRACKING_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                'batch_id', 'input_file', 'job_id', 'status', 'timestamp',
-                'target_language', 'output_file'
-            ])
-        if logger:
-            logger.info(
-                f"Created new batch tracking file: {BATCH_TRACKING_FILE}")
-        else:
-            print(f"Created new batch tracking file: {BATCH_TRACKING_FILE}")
-    else:
-        if logger:
-            logger.info(
-                f"Using existing batch tracking file: {BATCH_TRACKING_FILE}")
-
-
-def add_batch_record(batch_id,
-                     input_file,
-                     job_id,
-                     status,
-                     timestamp,
-                     target_language,
-                     output_file=None):
-    """Add a new batch record to the tracking CSV file."""
-    # Ensure the file exists with headers
-    initialize_batch_tracking()
-
-    # Append the new record
-    with open(BATCH_TRACKING_FILE, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            batch_id, input_file, job_id, status, timestamp, target_language,
-            output_file or ""
-        ])
-
-    if logger:
-        logger.info(f"Added batch record: {batch_id} -> {job_id} ({status})")
-    else:
-        print(f"Added batch record: {batch_id} -> {job_id} ({status})")
-
-
-def update_batch_status(job_id, new_status, output_file=None):
-    """Update the status of an existing batch record."""
-    if not Path(BATCH_TRACKING_FILE).exists():
-        if logger:
-            logger.warning(
-                f"Batch tracking file does not exist: {BATCH_TRACKING_FILE}")
-        else:
-            print(
-                f"Warning: Batch tracking file does not exist: {BATCH_TRACKING_FILE}"
-            )
-        return False
-
-    # Read all records
-    records = []
-    updated = False
-
-    with open(BATCH_TRACKING_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)
-        records.append(header)
-
-        for row in reader:
-            if len(row) >= 3 and row[2] == job_id:  # job_id is in column 2
-                # Update status (column 3) and output_file (column 6) if provided
-                row[3] = new_status
-                if output_file:
-                    row[6] = output_file
-                updated = True
-                if logger:
-                    logger.info(
-                        f"Updated batch record: {job_id} -> {new_status}")
-                else:
-                    print(f"Updated batch record: {job_id} -> {new_status}")
-            records.append(row)
-
-    if updated:
-        # Write back all records
-        with open(BATCH_TRACKING_FILE, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerows(records)
-        return True
-    else:
-        if logger:
-            logger.warning(f"Job ID not found in tracking file: {job_id}")
-        else:
-            print(f"Warning: Job ID not found in tracking file: {job_id}")
-        return False
-
-
-def get_batch_record(job_id):
-    """Get a batch record by job_id."""
-    if not Path(BATCH_TRACKING_FILE).exists():
-        return None
-
-    with open(BATCH_TRACKING_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row['job_id'] == job_id:
-                return row
-    return None
-
-
-def list_batch_records(status_filter=None):
-    """List all batch records, optionally filtered by status."""
-    if not Path(BATCH_TRACKING_FILE).exists():
-        if logger:
-            logger.info("No batch tracking file found")
-        return []
-
-    records = []
-    with open(BATCH_TRACKING_FILE, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if status_filter is None or row['status'] == status_filter:
-                records.append(row)
-
-    return records
+# Module logger; setup_logging() attaches the console and file handlers to
+# the root logger, and without them messages are dropped
+logger = logging.getLogger("auto_translate")
+logger.addHandler(logging.NullHandler())
+_worker_log_buffer = None  # Set in process_results worker processes
 
 
+@lru_cache(maxsize=16)
 def get_system_prompt(target_language):
+    # Cached so every request of a job carries the same string: OpenAI's
+    # prompt caching only applies to byte-identical leading messages.
     return f"""You are an expert automotive translator proficient in English and {target_language}. Your task is to translate technical automotive sentences from English into accurate, formal {target_language}.
 
 CRITICAL INSTRUCTIONS:
@@ -256,88 +162,235 @@ Output: {{"21": "<{target_language} translation>", "27": "<{target_language} tra
 IMPORTANT: Return ONLY the JSON object with translations. No explanations, no additional text."""
 
 
+@lru_cache(maxsize=4)
+def _get_encoding(model_name):
+    """Load the tiktoken encoding for a model once and reuse it.
+
+    Returns None if tiktoken does not know the model or cannot load its
+    vocabulary (it is downloaded on first use).
+    """
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except Exception as e:
+        logger.warning(f"No tiktoken encoding for {model_name}: {e}")
+        return None
+
+
+def estimate_tokens(text):
+    """Rough token count (~4 UTF-8 bytes per token) when tiktoken is unavailable."""
+    return (len(text.encode("utf-8")) + 3) // 4
+
+
 def count_tokens(text, encoding):
     return len(encoding.encode(text))
 
 
-def create_jsonl_from_csv(csv_filename, jsonl_filename, target_language):
-    """Create JSONL file from CSV with smaller batches and JSON format for better mapping."""
-    encoding = tiktoken.encoding_for_model(MODEL_NAME)
+@lru_cache(maxsize=32)
+def _count_fixed_tokens(model_name, text):
+    """Token count for strings reused across jobs, like the system prompt."""
+    return count_tokens(text, _get_encoding(model_name))
+
 
-    with open(csv_filename, 'r', encoding='utf-8') as csv_file:
+def iter_input_rows(csv_filename):
+    """Yield (description_id, sentence) pairs from the input CSV, skipping blank sentences."""
+    with open(csv_filename,
+              'r',
+              encoding='utf-8',
+              newline='',
+              buffering=CSV_READ_BUFFER_SIZE) as csv_file:
         reader = csv.reader(csv_file)
         next(reader)  # Skip the header row
-        data_rows = []
         for row in reader:
-            if len(row) > 1 and row[1].strip():
-                description_id = row[0].strip()
+            if len(row) > 1:
                 sentence = row[1].strip()
-                data_rows.append((description_id, sentence))
+                if sentence:
+                    # Ids are dict keys in several places; interning lets
+                    # lookups with the same id compare by identity
+                    yield sys.intern(row[0].strip()), sentence
+
+
+def load_input_rows(csv_filename):
+    """Read all (description_id, sentence) pairs from the input CSV."""
+    return list(iter_input_rows(csv_filename))
+
+
+def index_sentences_by_id(data_rows):
+    """Map description_id to its English sentence (first occurrence wins).
+
+    data_rows may be any iterable, such as iter_input_rows(), so the index
+    can be built without holding the whole CSV in a list.
+    """
+    english_by_id = {}
+    for description_id, sentence in data_rows:
+        english_by_id.setdefault(description_id, sentence)
+    return english_by_id
+
+
+def deduplicate_rows(data_rows):
+    """Keep the first row for each distinct sentence.
+
+    Returns (unique_rows, duplicates) where duplicates maps the description_id
+    of a kept row to (description_id, source_id) pairs for the repeated rows
+    that follow it in the input, up to the next kept row. source_id is the
+    kept row with the same sentence.
+    """
+    first_id_by_sentence = {}
+    unique_rows = []
+    duplicates = {}
+    last_kept_id = None
+    for row in data_rows:
+        description_id, sentence = row
+        first_id = first_id_by_sentence.get(sentence)
+        if first_id is None:
+            first_id_by_sentence[sentence] = description_id
+            unique_rows.append(row)  # Shared with data_rows, not copied
+            last_kept_id = description_id
+        else:
+            duplicates.setdefault(last_kept_id, []).append(
+                (description_id, first_id))
+    return unique_rows, duplicates
+
+
+def _batch_request_line(custom_id, batch_data, system_prompt):
+    """Serialize one batch as a Batch API request line (UTF-8 bytes)."""
+    # Create JSON object for the batch
+    batch_json = {}
+    for description_id, sentence in batch_data:
+        batch_json[description_id] = sentence
+
+    json_entry = {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model":
+            MODEL_NAME,
+            "messages": [{
+                "role": "system",
+                "content": system_prompt
+            }, {
+                "role": "user",
+                "content": orjson.dumps(batch_json).decode("utf-8")
+            }],
+            "temperature":
+            0,
+            "max_tokens":
+            MODEL_TOKEN_LIMIT,
+            # JSON mode: replies are always a single valid JSON object
+            "response_format": {
+                "type": "json_object"
+            }
+        }
+    }
+    return orjson.dumps(json_entry, option=orjson.OPT_APPEND_NEWLINE)
+
+
+def _close_batch(jsonl_file, batch_mapping, batch_data, system_prompt):
+    """Write a finished batch's request line and record its description_ids."""
+    custom_id = f"batch-{len(batch_mapping) + 1:04d}"
+    jsonl_file.write(_batch_request_line(custom_id, batch_data,
+                                         system_prompt))
+    batch_mapping[custom_id] = [
+        description_id for description_id, _ in batch_data
+    ]
+
+
+def create_jsonl_from_csv(csv_filename, jsonl_filename, target_language):
+    """Create JSONL file from CSV with smaller batches and JSON format for better mapping.
+
+    Repeated sentences are sent once. Returns (batch_mapping, english_by_id,
+    duplicates): batch_mapping maps each request's custom_id to the
+    description_ids it carries, and the other two let process_results reuse
+    the parsed CSV instead of reading it again and copy each translation to
+    the duplicate rows.
+    """
+    all_rows = load_input_rows(csv_filename)
+    data_rows, duplicates = deduplicate_rows(all_rows)
+    duplicate_count = len(all_rows) - len(data_rows)
+    if duplicate_count:
+        logger.info(
+            f"Skipping {duplicate_count} repeated sentences; they reuse the translation of their first occurrence"
+        )
 
     system_prompt = get_system_prompt(target_language)
-    system_prompt_tokens = count_tokens(system_prompt, encoding)
 
-    batches = []
+    # JSON pair as it appears in the batch: "id":"sentence"
+    json_pairs = [
+        orjson.dumps({description_id: sentence})[1:-1].decode("utf-8")
+        for description_id, sentence in data_rows
+    ]
+
+    # Every token covers at least one UTF-8 byte, so byte lengths are upper
+    # bounds on token counts. If everything fits in one batch even by that
+    # measure, the bounds give the same single batch as exact counts and
+    # tiktoken is never loaded.
+    system_prompt_tokens = len(system_prompt.encode("utf-8"))
+    brace_tokens = 2
+    separator_tokens = 1
+    pair_token_counts = [len(pair.encode("utf-8")) for pair in json_pairs]
+    upper_bound = system_prompt_tokens + brace_tokens + sum(
+        line_tokens + int(line_tokens * EXPECTED_OUTPUT_FACTOR)
+        for line_tokens in (pair_tokens + separator_tokens
+                            for pair_tokens in pair_token_counts))
+
+    if upper_bound > MODEL_TOKEN_LIMIT:
+        encoding = _get_encoding(MODEL_NAME)
+        if encoding is None:
+            logger.warning(
+                "Estimating batch sizes at ~4 bytes per token instead")
+            system_prompt_tokens = estimate_tokens(system_prompt)
+            brace_tokens = estimate_tokens("{}")
+            separator_tokens = estimate_tokens(",")
+            pair_token_counts = [(n + 3) // 4 for n in pair_token_counts]
+        else:
+            system_prompt_tokens = _count_fixed_tokens(MODEL_NAME,
+                                                       system_prompt)
+            brace_tokens = _count_fixed_tokens(MODEL_NAME, "{}")
+            separator_tokens = _count_fixed_tokens(MODEL_NAME, ",")
+            # All rows are tokenized in one call so tiktoken can spread the
+            # work across threads.
+            pair_token_counts = [
+                len(tokens) for tokens in encoding.encode_ordinary_batch(
+                    json_pairs, num_threads=os.cpu_count() or 8)
+            ]
+
+    # Each batch is a single JSON object: its braces are counted once per
+    # batch, each row only adds its '"id":"sentence"' pair and a separator.
+    batch_base_tokens = system_prompt_tokens + brace_tokens
+
+    batch_mapping = {}
     current_batch = []
-    current_tokens = system_prompt_tokens
-
-    for (description_id, sentence) in data_rows:
-        # Create JSON format: {"id": "sentence"}
-        json_entry = {description_id: sentence}
-        json_str = json.dumps(json_entry, ensure_ascii=False)
-        line_tokens = count_tokens(json_str, encoding)
-        est_output_tokens = int(line_tokens * EXPECTED_OUTPUT_FACTOR)
-        total_if_added = current_tokens + line_tokens + est_output_tokens
-
-        if total_if_added > MODEL_TOKEN_LIMIT and current_batch:
-            batches.append(current_batch)
-            current_batch = []
-            current_tokens = system_prompt_tokens
-
-        current_batch.append((description_id, sentence))
-        current_tokens += line_tokens + est_output_tokens
-
-    if current_batch:
-        batches.append(current_batch)
-
-    with open(jsonl_filename, 'w', encoding='utf-8') as jsonl_file:
-        for batch_num, batch_data in enumerate(batches, 1):
-            # Create JSON object for the batch
-            batch_json = {}
-            for description_id, sentence in batch_data:
-                batch_json[description_id] = sentence
-
-            json_entry = {
-                "custom_id": f"batch-{batch_num:04d}",
-                "method": "POST",
-                "url": "/v1/chat/completions",
-                "body": {
-                    "model":
-                    MODEL_NAME,
-                    "messages": [{
-                        "role": "system",
-                        "content": system_prompt
-                    }, {
-                        "role":
-                        "user",
-                        "content":
-                        json.dumps(batch_json, ensure_ascii=False)
-                    }],
-                    "temperature":
-                    0,
-                    "max_tokens":
-                    MODEL_TOKEN_LIMIT
-                }
-            }
-            jsonl_file.write(json.dumps(json_entry, ensure_ascii=False) + '\n')
+    current_tokens = batch_base_tokens
+
+    # Each request line is written as soon as its batch is closed
+    with open(jsonl_filename, 'wb',
+              buffering=JSONL_WRITE_BUFFER_SIZE) as jsonl_file:
+        for (description_id, sentence), pair_tokens in zip(
+                data_rows, pair_token_counts):
+            line_tokens = pair_tokens + separator_tokens
+            est_output_tokens = int(line_tokens * EXPECTED_OUTPUT_FACTOR)
+            total_if_added = current_tokens + line_tokens + est_output_tokens
+
+            if total_if_added > MODEL_TOKEN_LIMIT and current_batch:
+                _close_batch(jsonl_file, batch_mapping, current_batch,
+                             system_prompt)
+                current_batch = []
+                current_tokens = batch_base_tokens
+
+            current_batch.append((description_id, sentence))
+            current_tokens += line_tokens + est_output_tokens
+
+        if current_batch:
+            _close_batch(jsonl_file, batch_mapping, current_batch,
+                         system_prompt)
 
     logger.info(
-        f"Created JSONL file with {len(data_rows)} sentences across {len(batches)} batches"
+        f"Created JSONL file with {len(data_rows)} sentences across {len(batch_mapping)} batches"
     )
     logger.info(
-        f"Average batch size: {len(data_rows)/len(batches):.1f} sentences per batch"
+        f"Average batch size: {len(data_rows)/len(batch_mapping):.1f} sentences per batch"
     )
-    return batches
+    return batch_mapping, index_sentences_by_id(all_rows), duplicates
 
 
 def upload_batch_file(jsonl_path):
@@ -359,29 +412,130 @@ def create_batch_job(input_file_id):
     return job
 
 
-def poll_until_done(job_id):
-    """Poll job until completion."""
+def poll_jobs_until_done(job_ids):
+    """Poll several jobs from one loop, yielding each once it is terminal.
+
+    Every pending job is checked each round and all of them share one
+    exponential backoff, so any number of jobs can be awaited without a
+    thread per job.
+    """
     logger.info("Polling job status...")
-    while True:
-        job = client.batches.retrieve(job_id)
-        status = job.status
-        logger.info(f"Status: {status}")
+    failed_attempts = dict.fromkeys(job_ids, 0)  # Pending job -> failed checks
+    delay = POLL_INITIAL_INTERVAL
+    while failed_attempts:
+        wait = delay + random.uniform(0, delay * POLL_JITTER)
+        for job_id in list(failed_attempts):
+            try:
+                job = client.batches.retrieve(job_id)
+            except TRANSIENT_API_ERRORS as e:
+                failed_attempts[job_id] += 1
+                if failed_attempts[job_id] >= POLL_MAX_ATTEMPTS:
+                    raise
+                logger.warning(
+                    f"Status check for {job_id} failed ({e}). Retrying in {wait:.0f} seconds..."
+                )
+                continue
+            failed_attempts[job_id] = 0
+            logger.info(f"Status of {job_id}: {job.status}")
+
+            if job.status in TERMINAL_JOB_STATUSES:
+                del failed_attempts[job_id]
+                yield job
+
+        if failed_attempts:
+            logger.info(
+                f"{len(failed_attempts)} job(s) still running. Waiting {wait:.0f} seconds..."
+            )
+            time.sleep(wait)
+            delay = min(delay * POLL_BACKOFF_FACTOR, POLL_INTERVAL)
+
+
+def poll_until_done(job_id):
+    """Poll job until it reaches a terminal status, backing off exponentially."""
+    return next(poll_jobs_until_done([job_id]))
+
+
+def _send_direct_request(request):
+    """Send one batch request line as a chat completion, retrying transient errors.
+
+    Returns the result as a line of Batch API output.
+    """
+    custom_id = request["custom_id"]
+    for attempt in range(1, DIRECT_MAX_ATTEMPTS + 1):
+        try:
+            completion = direct_client.chat.completions.create(
+                **request["body"])
+            return {
+                "custom_id": custom_id,
+                "response": {
+                    "status_code": 200,
+                    "body": completion.model_dump(mode="json")
+                },
+                "error": None
+            }
+        except TRANSIENT_API_ERRORS as e:
+            if attempt == DIRECT_MAX_ATTEMPTS:
+                error = e
+                break
+            wait = 2**attempt + random.uniform(0, 1)
+            logger.warning(
+                f"{custom_id}: request failed ({e}). Retrying in {wait:.0f} seconds..."
+            )
+            time.sleep(wait)
+        except Exception as e:
+            error = e
+            break
+
+    logger.error(f"{custom_id}: request failed: {error}")
+    return {
+        "custom_id": custom_id,
+        "response": None,
+        "error": {
+            "message": str(error)
+        }
+    }
+
+
+def run_direct_requests(jsonl_path,
+                        output_jsonl,
+                        max_workers=DIRECT_MAX_WORKERS):
+    """Send every request of a batch JSONL directly instead of as a batch job.
+
+    Results are written to output_jsonl in the Batch API output format, so
+    process_results reads them the same way. Returns the number of failed
+    requests.
+    """
+    with open(jsonl_path, "rb") as f:
+        requests = [orjson.loads(line) for line in f if line.strip()]
+
+    logger.info(
+        f"Sending {len(requests)} requests directly ({max_workers} at a time)..."
+    )
+    with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=threading.current_thread().name) as executor:
+        results = list(executor.map(_send_direct_request, requests))
 
-        if status in ("completed", "failed"):
-            return job
+    with open(output_jsonl, "wb") as f:
+        f.writelines(
+            orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE)
+            for result in results)
 
-        logger.info(f"Job still {status}. Waiting {POLL_INTERVAL} seconds...")
-        time.sleep(POLL_INTERVAL)
+    failed = sum(1 for result in results if result["error"])
+    logger.info(
+        f"Direct requests done: {len(results) - failed} succeeded, {failed} failed"
+    )
+    return failed
 
 
 def download_file(file_id, dest_path):
     """Download file from OpenAI."""
     logger.info(f"Downloading file {file_id} to {dest_path}...")
     try:
-        file_response = client.files.content(file_id)
-        content = file_response.content
-        with open(dest_path, "wb") as f:
-            f.write(content)
+        with client.files.with_streaming_response.content(file_id) as response, \
+             open(dest_path, "wb") as f:
+            for chunk in response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
         logger.info("Download complete.")
         return True
     except Exception as e:
@@ -389,21 +543,129 @@ def download_file(file_id, dest_path):
         return False
 
 
-def parse_output_jsonl(output_jsonl_path):
-    """Parse output JSONL and return custom_id -> content mapping."""
+def _parse_output_chunk(output_jsonl_path, start, end):
+    """Parse the output lines that begin in the byte range [start, end).
+
+    Returns (results, prompt_tokens, cached_tokens) for that range.
+    """
     results = {}
-    with open(output_jsonl_path, encoding="utf-8") as f:
-        for line in f:
-            if not line.strip():
+    prompt_tokens = 0
+    cached_tokens = 0
+    if start >= end:
+        return results, prompt_tokens, cached_tokens
+
+    # Lines are parsed straight from the mapped file, without copying them
+    with open(output_jsonl_path, "rb") as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+            memoryview(mm) as view:
+        size = len(mm)
+        pos = start
+        if start:
+            # Skip the line running into the range; it belongs to the
+            # previous chunk
+            newline = mm.find(b"\n", start - 1)
+            pos = newline + 1 if newline >= 0 else size
+        while pos < end:
+            newline = mm.find(b"\n", pos)
+            line_end = newline if newline >= 0 else size
+            with view[pos:line_end] as line:
+                try:
+                    item = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    if bytes(line).strip():
+                        raise
+                    item = None  # Blank line
+            pos = line_end + 1
+            if item is None:
                 continue
-            item = json.loads(line)
             cid = item.get("custom_id")
             try:
-                content = item["response"]["body"]["choices"][0]["message"][
-                    "content"]
+                body = item["response"]["body"]
+                content = body["choices"][0]["message"]["content"]
             except Exception:
                 content = None
+            else:
+                usage = body.get("usage") or {}
+                prompt_tokens += usage.get("prompt_tokens") or 0
+                details = usage.get("prompt_tokens_details") or {}
+                cached_tokens += details.get("cached_tokens") or 0
             results[cid] = content
+    return results, prompt_tokens, cached_tokens
+
+
+def _iter_mapped_lines(path, start=0, end=None):
+    """Yield each line of a file as bytes, read through a memory map.
+
+    With start/end only the lines beginning in that byte range are read;
+    start must be the first byte of a line.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            stop = size if end is None else end
+            while start < stop:
+                line_end = mm.find(b"\n", start)
+                if line_end < 0:
+                    line_end = size
+                yield mm[start:line_end]
+                start = line_end + 1
+
+
+def _line_aligned_chunks(path, chunk_size):
+    """Split a file into byte ranges of about chunk_size that end on a newline.
+
+    Returns (start, end, first_line_number) tuples, numbering lines from 1.
+    """
+    chunks = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return chunks
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            line_number = 1
+            while start < size:
+                newline = mm.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if newline < 0 else newline + 1
+                chunks.append((start, end, line_number))
+                # Count the lines in slices to keep the copies small
+                for pos in range(start, end, LINE_COUNT_SLICE_BYTES):
+                    line_number += mm[pos:min(pos + LINE_COUNT_SLICE_BYTES,
+                                              end)].count(b"\n")
+                start = end
+    return chunks
+
+
+def parse_output_jsonl(output_jsonl_path):
+    """Parse output JSONL and return custom_id -> content mapping."""
+    file_size = os.path.getsize(output_jsonl_path)
+    workers = os.cpu_count() or 1
+    if file_size < PARALLEL_PARSE_MIN_BYTES or workers < 2:
+        chunks = [_parse_output_chunk(output_jsonl_path, 0, file_size)]
+    else:
+        # Split on byte offsets; each worker realigns to the next line
+        step = -(-file_size // workers)
+        bounds = [(start, min(start + step, file_size))
+                  for start in range(0, file_size, step)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(
+                executor.map(_parse_output_chunk,
+                             [output_jsonl_path] * len(bounds),
+                             *zip(*bounds)))
+
+    results = {}
+    prompt_tokens = 0
+    cached_tokens = 0
+    for chunk_results, chunk_prompt, chunk_cached in chunks:
+        results.update(chunk_results)
+        prompt_tokens += chunk_prompt
+        cached_tokens += chunk_cached
+    if prompt_tokens:
+        logger.info(
+            f"Prompt tokens: {prompt_tokens} ({cached_tokens} served from prompt cache, {cached_tokens/prompt_tokens*100:.1f}%)"
+        )
     return results
 
 
@@ -423,27 +685,26 @@ def _cleanup_markdown_basic(blob):
     return cleaned.strip()
 
 
+# Code block markers with optional language specifiers
+_MD_FENCE_OPEN = re.compile(r'^```(?:json|javascript|text)?\s*\n?',
+                            re.MULTILINE)
+_MD_FENCE_CLOSE = re.compile(r'\n?```\s*$', re.MULTILINE)
+
+
 def _cleanup_markdown_aggressive(blob):
     """Aggressive markdown cleanup using regex patterns."""
-    import re
-
     # Remove all code block markers with optional language specifiers
-    cleaned = re.sub(r'^```(?:json|javascript|text)?\s*\n?',
-                     '',
-                     blob.strip(),
-                     flags=re.MULTILINE)
-    cleaned = re.sub(r'\n?```\s*$', '', cleaned, flags=re.MULTILINE)
+    cleaned = _MD_FENCE_OPEN.sub('', blob.strip())
+    cleaned = _MD_FENCE_CLOSE.sub('', cleaned)
 
     # Remove any remaining triple backticks
-    cleaned = re.sub(r'```', '', cleaned)
+    cleaned = cleaned.replace('```', '')
 
     return cleaned.strip()
 
 
 def _cleanup_markdown_multiline(blob):
     """Handle multiline markdown with embedded newlines in code blocks."""
-    import re
-
     # Split by lines and remove markdown markers
     lines = blob.split('\n')
     cleaned_lines = []
@@ -466,17 +727,20 @@ def _cleanup_markdown_multiline(blob):
     return _cleanup_markdown_basic(blob)
 
 
+# Whitespace and stray quotes around a reply
+_LEADING_QUOTES = re.compile(r'^\s*[\'"]*')
+_TRAILING_QUOTES = re.compile(r'[\'"]*\s*$')
+
+
 def _cleanup_unicode_and_escapes(blob):
     """Handle Unicode escapes and special characters in JSON."""
-    import re
-
     # First do basic markdown cleanup
     cleaned = _cleanup_markdown_basic(blob)
 
     # Fix common JSON formatting issues
     # Remove any leading/trailing whitespace and normalize quotes
-    cleaned = re.sub(r'^\s*[\'"]*', '', cleaned)
-    cleaned = re.sub(r'[\'"]*\s*$', '', cleaned)
+    cleaned = _LEADING_QUOTES.sub('', cleaned)
+    cleaned = _TRAILING_QUOTES.sub('', cleaned)
 
     # Ensure proper JSON structure if it looks like it should be an object
     if not cleaned.startswith('{') and ':' in cleaned:
@@ -487,45 +751,94 @@ def _cleanup_unicode_and_escapes(blob):
     return cleaned.strip()
 
 
-def split_translations_by_id(translated_blob):
-    """Enhanced extraction of translations by description_id from JSON format with robust parsing."""
-    if not translated_blob:
-        return {}
-
+def _translations_from_json(json_data):
+    """Keep the non-empty, non-suspicious translations of a parsed JSON reply."""
     translations = {}
+    for desc_id, translation in json_data.items():
+        if translation and str(translation).strip():
+            clean_translation = str(translation).strip()
+            if not is_suspicious_translation(clean_translation):
+                translations[sys.intern(str(desc_id))] = clean_translation
+    return translations
 
-    # Strategy 1: Enhanced JSON parsing with multiple cleanup attempts
-    for strategy_num, cleanup_func in enumerate([
-            _cleanup_markdown_basic, _cleanup_markdown_aggressive,
-            _cleanup_markdown_multiline, _cleanup_unicode_and_escapes
-    ], 1):
+
+# Cleanup strategies tried in order on replies that are not plain JSON
+_JSON_CLEANUP_STRATEGIES = (_cleanup_markdown_basic,
+                            _cleanup_markdown_aggressive,
+                            _cleanup_markdown_multiline,
+                            _cleanup_unicode_and_escapes)
+
+
+def _json_reply_translations(translated_blob, log_attempts=True):
+    """Parse a reply holding a JSON object, trying the cleanup strategies.
+
+    Returns the kept translations, or None if no strategy yields a JSON
+    object. Strategy results are logged unless log_attempts is False (the
+    analyzer reports unparsed batches itself).
+    """
+    # Fast path: JSON mode replies are a plain JSON object
+    try:
+        json_data = orjson.loads(translated_blob)
+    except orjson.JSONDecodeError:
+        json_data = None
+    if isinstance(json_data, dict) and json_data:
+        return _translations_from_json(json_data)
+
+    first_brace = translated_blob.find('{')
+    if first_brace >= 0:
+        # Replies wrapped in markdown or prose usually hold one JSON object
+        try:
+            json_data = orjson.loads(
+                translated_blob[first_brace:translated_blob.rfind('}') + 1])
+        except orjson.JSONDecodeError:
+            json_data = None
+        if isinstance(json_data, dict) and json_data:
+            return _translations_from_json(json_data)
+        first_strategy = 1
+    else:
+        # Without braces only the last strategy, which adds them, can succeed
+        first_strategy = len(_JSON_CLEANUP_STRATEGIES)
+
+    for strategy_num, cleanup_func in enumerate(
+            _JSON_CLEANUP_STRATEGIES[first_strategy - 1:], first_strategy):
         try:
             cleaned_blob = cleanup_func(translated_blob)
             if not cleaned_blob:
                 continue
 
-            # Try to parse as JSON
-            json_data = json.loads(cleaned_blob)
+            # Try to parse as JSON (orjson errors subclass JSONDecodeError)
+            json_data = orjson.loads(cleaned_blob)
             if isinstance(json_data, dict) and json_data:
-                logger.info(
-                    f"Successfully parsed JSON using cleanup strategy {strategy_num}"
-                )
+                if log_attempts:
+                    logger.info(
+                        f"Successfully parsed JSON using cleanup strategy {strategy_num}"
+                    )
                 # Direct JSON mapping - this is what we want
-                for desc_id, translation in json_data.items():
-                    if translation and str(translation).strip():
-                        clean_translation = str(translation).strip()
-                        if not is_suspicious_translation(clean_translation):
-                            translations[str(desc_id)] = clean_translation
-                return translations
+                return _translations_from_json(json_data)
         except json.JSONDecodeError as e:
-            if strategy_num == 1:  # Only print detailed error for first strategy
+            # Only detail the first failure
+            if log_attempts and strategy_num == first_strategy:
                 logger.warning(
                     f"JSON decode strategy {strategy_num} failed: {e}")
                 logger.debug(f"First 200 chars: {translated_blob[:200]}...")
             continue
         except Exception as e:
-            logger.error(f"Unexpected error in strategy {strategy_num}: {e}")
+            if log_attempts:
+                logger.error(
+                    f"Unexpected error in strategy {strategy_num}: {e}")
             continue
+    return None
+
+
+def split_translations_by_id(translated_blob):
+    """Enhanced extraction of translations by description_id from JSON format with robust parsing."""
+    if not translated_blob:
+        return {}
+
+    # Strategy 1: Enhanced JSON parsing with multiple cleanup attempts
+    translations = _json_reply_translations(translated_blob)
+    if translations is not None:
+        return translations
 
     # Strategy 2: Enhanced fallback parsing with better error recovery
     logger.warning(
@@ -534,63 +847,41 @@ def split_translations_by_id(translated_blob):
     return _fallback_line_parsing(translated_blob)
 
 
-def _fallback_line_parsing_no_logger(translated_blob):
-    """Enhanced fallback parsing for non-JSON formatted responses without logger dependency."""
-    translations = {}
-    lines = [l.strip() for l in translated_blob.splitlines() if l.strip()]
+# Line formats recognised by the fallback parser, as one alternation tried
+# left to right. Each branch captures <name>_id and then <name>_val.
+_FALLBACK_LINE_RE = re.compile(
+    # Pattern 1: JSON-like "id": "translation"
+    r'^(?:"?(?P<kv_id>\d+)"?\s*:\s*"(?P<kv_val>.+?)"$'
+    # Pattern 2: "277. ('597', 'translation')" - tuple format, inner ID wins
+    r"|\d+\.\s*\('(?P<tuple_id>\d+)',\s*'(?P<tuple_val>.+?)'\)$"
+    # Pattern 3: "desc_021. translation" or "21. translation"
+    r"|(?:desc_)?(?P<num_id>\d+)\.\s*(?P<num_val>.*)$"
+    # Pattern 4: Generic "key. value" format
+    r"|(?P<key_id>[^.]+)\.\s*(?P<key_val>.*)$)")
 
-    for l in lines:
-        # Skip code blocks and other non-translation content
-        if l.startswith('```') or l.startswith('<') or l in [
-                'plaintext', 'json', 'text'
-        ]:
-            continue
 
-        # Try multiple patterns to handle different output formats
-        patterns = [
-            # Pattern 1: JSON-like "id": "translation"
-            r'^"?(\d+)"?\s*:\s*"(.+?)"$',
-            # Pattern 2: "277. ('597', 'translation')" - tuple format (handle first)
-            r"^(\d+)\.\s*\(\'(\d+)\',\s*\'(.+?)\'\)$",
-            # Pattern 3: "desc_021. translation" or "21. translation"
-            r"^(?:desc_)?(\d+)\.\s*(.*)$",
-            # Pattern 4: Generic "key. value" format
-            r"^([^.]+)\.\s*(.*)$"
-        ]
-
-        matched = False
-        for pattern in patterns:
-            m = re.match(pattern, l)
-            if m:
-                if len(m.groups()) == 2:
-                    # Standard format
-                    description_id = m.group(1)
-                    translation = m.group(2)
-                elif len(m.groups()) == 3:
-                    # Tuple format: use the ID from inside the tuple
-                    description_id = m.group(2)
-                    translation = m.group(3)
-
-                # Clean up description_id (remove 'desc_' prefix if present)
-                if description_id.startswith('desc_'):
-                    description_id = description_id[5:]
-
-                # Clean up translation (remove quotes if present)
-                translation = translation.strip().strip('"').strip("'")
-
-                # Only add if translation is not empty and not suspicious
-                if translation and not is_suspicious_translation(translation):
-                    translations[description_id] = translation
-                matched = True
-                break
+def _init_split_worker():
+    """Buffer log messages in worker processes started by process_results."""
+    global _worker_log_buffer
+    _worker_log_buffer = _BufferingHandler()
+    logger.handlers = [_worker_log_buffer]
+    logger.propagate = False
 
-        # For unmatched lines, we just skip them silently in this version
 
-    return translations
+def _split_reply_in_worker(translated_blob):
+    """Run split_translations_by_id in a worker; also return its log messages."""
+    translations = split_translations_by_id(translated_blob)
+    records = _worker_log_buffer.records
+    _worker_log_buffer.records = []
+    return translations, records
+
 
+def _fallback_line_parsing(translated_blob, warn_unmatched=True):
+    """Enhanced fallback parsing for non-JSON formatted responses.
 
-def _fallback_line_parsing(translated_blob):
-    """Enhanced fallback parsing for non-JSON formatted responses."""
+    Unparseable lines are logged as warnings unless warn_unmatched is False
+    (the analyzer reports unparsed batches itself).
+    """
     translations = {}
     lines = [l.strip() for l in translated_blob.splitlines() if l.strip()]
 
@@ -601,79 +892,60 @@ def _fallback_line_parsing(translated_blob):
         ]:
             continue
 
-        # Try multiple patterns to handle different output formats
-        patterns = [
-            # Pattern 1: JSON-like "id": "translation"
-            r'^"?(\d+)"?\s*:\s*"(.+?)"$',
-            # Pattern 2: "277. ('597', 'translation')" - tuple format (handle first)
-            r"^(\d+)\.\s*\(\'(\d+)\',\s*\'(.+?)\'\)$",
-            # Pattern 3: "desc_021. translation" or "21. translation"
-            r"^(?:desc_)?(\d+)\.\s*(.*)$",
-            # Pattern 4: Generic "key. value" format
-            r"^([^.]+)\.\s*(.*)$"
-        ]
-
-        matched = False
-        for pattern in patterns:
-            m = re.match(pattern, l)
-            if m:
-                if len(m.groups()) == 2:
-                    # Standard format
-                    description_id = m.group(1)
-                    translation = m.group(2)
-                elif len(m.groups()) == 3:
-                    # Tuple format: use the ID from inside the tuple
-                    description_id = m.group(2)
-                    translation = m.group(3)
-
-                # Clean up description_id (remove 'desc_' prefix if present)
-                if description_id.startswith('desc_'):
-                    description_id = description_id[5:]
-
-                # Clean up translation (remove quotes if present)
-                translation = translation.strip().strip('"').strip("'")
-
-                # Only add if translation is not empty and not suspicious
-                if translation and not is_suspicious_translation(translation):
-                    translations[description_id] = translation
-                matched = True
-                break
+        # One match covers every supported output format
+        m = _FALLBACK_LINE_RE.match(l)
+        if m:
+            # The last group of the matched branch holds the translation
+            translation = m.group(m.lastgroup)
+            description_id = m.group(m.lastgroup[:-3] + 'id')
+
+            # Clean up description_id (remove 'desc_' prefix if present)
+            if description_id.startswith('desc_'):
+                description_id = description_id[5:]
+
+            # Clean up translation (remove quotes if present)
+            translation = translation.strip().strip('"').strip("'")
+
+            # Only add if translation is not empty and not suspicious
+            if translation and not is_suspicious_translation(translation):
+                translations[description_id] = translation
 
         # Debug: print unmatched lines for troubleshooting
-        if not matched and l and len(translations) < 10:
+        elif warn_unmatched and len(translations) < 10:
             logger.warning(f"Could not parse line: {l[:100]}...")
 
     return translations
 
 
+_SUSPICIOUS_TOKENS = frozenset({
+    "[translation_failed]", "plaintext", "text", "code", "output", "none",
+    "null", "undefined", "error", "failed", "missing", "empty", "json",
+    "translation", "response", "content", "message", "system", "user"
+})
+
+
 def is_suspicious_translation(text):
     """Check if translation is suspicious."""
     if not text or not isinstance(text, str):
         return True
 
-    text_lower = text.strip().lower()
-    suspicious_tokens = {
-        "[translation_failed]", "plaintext", "text", "code", "output", "none",
-        "null", "undefined", "error", "failed", "missing", "empty", "json",
-        "translation", "response", "content", "message", "system", "user"
-    }
-
-    if text_lower in suspicious_tokens:
-        return True
-    if text.strip().startswith("```") or text.strip().startswith("<"):
+    stripped = text.strip()
+    if len(stripped) < 3:  # Very short translations are suspicious
         return True
-    if text.strip().startswith("{") or text.strip().startswith("["):
+    if stripped.startswith(("```", "<", "{", "[")):
         return True
-    if len(text.strip()) < 3:  # Very short translations are suspicious
-        return True
-    if text.strip().isdigit():  # Pure numbers are suspicious
+    if stripped.isdigit():  # Pure numbers are suspicious
         return True
 
-    return False
+    return stripped.lower() in _SUSPICIOUS_TOKENS
 
 
 # ===== TRUNCATION REPAIR FUNCTIONS =====
 
+# Reply patterns used by the truncation repair helpers
+_OPEN_JSON_BLOCK = re.compile(r'```json\s*\n(\{.*)', re.DOTALL)
+_COMPLETE_ENTRY_LINE = re.compile(r'\s*"[^"]*":\s*"[^"]*"')
+
 
 def detect_truncation_issues(content):
     """Detect if content has truncation issues."""
@@ -689,9 +961,8 @@ def detect_truncation_issues(content):
         return True
 
     # Check for incomplete lines at the end
-    lines = content.strip().split('\n')
-    if lines and lines[-1].strip() and not lines[-1].strip().endswith(
-        ('}', '"', ',')):
+    last_line = content.rstrip().rpartition('\n')[2].strip()
+    if last_line and not last_line.endswith(('}', '"', ',')):
         return True
 
     return False
@@ -699,18 +970,15 @@ def detect_truncation_issues(content):
 
 def fix_truncated_content(content, batch_id="unknown"):
     """Fix truncated markdown/JSON content."""
-    global logger
-
     if not content.startswith('```json'):
         return content
 
     # Check if it's truncated (missing closing backticks)
     if not content.rstrip().endswith('```'):
-        if logger:
-            logger.info(f"Batch {batch_id}: Fixing truncated content...")
+        logger.info(f"Batch {batch_id}: Fixing truncated content...")
 
         # Extract JSON part
-        json_match = re.search(r'```json\s*\n(\{.*)', content, re.DOTALL)
+        json_match = _OPEN_JSON_BLOCK.search(content)
         if json_match:
             json_part = json_match.group(1)
 
@@ -724,8 +992,6 @@ def fix_truncated_content(content, batch_id="unknown"):
 
 def fix_incomplete_json(json_str, batch_id="unknown"):
     """Fix incomplete JSON by adding missing closing brackets."""
-    global logger
-
     # Clean up the string
     json_str = json_str.rstrip().rstrip(',')
 
@@ -740,17 +1006,15 @@ def fix_incomplete_json(json_str, batch_id="unknown"):
 
         try:
             # Validate the fixed JSON
-            parsed = json.loads(json_str)
-            if logger:
-                logger.info(
-                    f"Batch {batch_id}: Successfully fixed JSON with {missing_braces} missing braces"
-                )
+            parsed = orjson.loads(json_str)
+            logger.info(
+                f"Batch {batch_id}: Successfully fixed JSON with {missing_braces} missing braces"
+            )
             return json.dumps(parsed, ensure_ascii=False, indent=4)
         except json.JSONDecodeError:
-            if logger:
-                logger.warning(
-                    f"Batch {batch_id}: Simple brace fix failed, trying alternative approach"
-                )
+            logger.warning(
+                f"Batch {batch_id}: Simple brace fix failed, trying alternative approach"
+            )
 
     # Alternative: find last complete entry and close properly
     lines = json_str.split('\n')
@@ -759,7 +1023,7 @@ def fix_incomplete_json(json_str, batch_id="unknown"):
     for i in range(len(lines) - 1, -1, -1):
         line = lines[i].strip()
         # Look for complete translation entry pattern
-        if re.match(r'\s*"[^"]*":\s*"[^"]*"', line):
+        if _COMPLETE_ENTRY_LINE.match(line):
             last_valid_line = i
             break
 
@@ -780,62 +1044,59 @@ def fix_incomplete_json(json_str, batch_id="unknown"):
             reconstructed += '\n' + '}' * missing_braces
 
         try:
-            parsed = json.loads(reconstructed)
-            if logger:
-                logger.info(
-                    f"Batch {batch_id}: Successfully reconstructed JSON from {len(valid_lines)} valid lines"
-                )
+            parsed = orjson.loads(reconstructed)
+            logger.info(
+                f"Batch {batch_id}: Successfully reconstructed JSON from {len(valid_lines)} valid lines"
+            )
             return json.dumps(parsed, ensure_ascii=False, indent=4)
         except json.JSONDecodeError:
-            if logger:
-                logger.warning(f"Batch {batch_id}: JSON reconstruction failed")
+            logger.warning(f"Batch {batch_id}: JSON reconstruction failed")
 
     return None
 
 
 def extract_json_from_markdown(content, batch_id="unknown"):
     """Extract JSON content from markdown code blocks."""
-    global logger
-
-    # Pattern to match ```json ... ```
-    json_match = re.search(r'```json\s*\n(\{.*?\})\s*\n```', content,
-                           re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1)
+    # Locate ```json { ... } ``` with plain string searches
+    json_str = None
+    fence_start = content.find('```json')
+    if fence_start >= 0:
+        brace_start = content.find('{', fence_start + 7)
+        fence_end = content.find('\n```', brace_start)
+        if brace_start >= 0 and fence_end >= 0:
+            brace_end = content.rfind('}', brace_start, fence_end)
+            if brace_end >= 0:
+                json_str = content[brace_start:brace_end + 1]
+
+    if json_str is not None:
         try:
             # Validate the JSON
-            parsed = json.loads(json_str)
+            parsed = orjson.loads(json_str)
             # Return clean, formatted JSON
             return json.dumps(parsed,
                               ensure_ascii=False,
                               separators=(',', ': '))
         except json.JSONDecodeError as e:
-            if logger:
-                logger.warning(
-                    f"Batch {batch_id}: Invalid JSON in markdown - {e}")
-    else:
-        if logger:
             logger.warning(
-                f"Batch {batch_id}: No JSON found in markdown block")
+                f"Batch {batch_id}: Invalid JSON in markdown - {e}")
+    else:
+        logger.warning(
+            f"Batch {batch_id}: No JSON found in markdown block")
 
     return None
 
 
 def attempt_auto_repair(content, batch_id):
     """Attempt to automatically repair truncated content."""
-    global logger
-
     if not AUTO_REPAIR_ENABLED:
         return None
 
-    if logger:
-        logger.info(f"Attempting auto-repair for batch {batch_id}")
+    logger.info(f"Attempting auto-repair for batch {batch_id}")
 
     # Step 1: Fix truncated content if needed
     fixed_content = fix_truncated_content(content, batch_id)
     if fixed_content != content:
-        if logger:
-            logger.info(f"Batch {batch_id}: Content truncation fixed")
+        logger.info(f"Batch {batch_id}: Content truncation fixed")
 
     # Step 2: Extract JSON from markdown
     clean_json = extract_json_from_markdown(fixed_content, batch_id)
@@ -843,38 +1104,32 @@ def attempt_auto_repair(content, batch_id):
     if clean_json:
         try:
             # Validate and count translations
-            translations = json.loads(clean_json)
+            translations = orjson.loads(clean_json)
             translation_count = len(translations)
 
-            if logger:
-                logger.info(
-                    f"Batch {batch_id}: Auto-repair successful - extracted {translation_count} translations"
-                )
+            logger.info(
+                f"Batch {batch_id}: Auto-repair successful - extracted {translation_count} translations"
+            )
 
             return translations
         except json.JSONDecodeError:
-            if logger:
-                logger.error(
-                    f"Batch {batch_id}: Auto-repair failed - invalid JSON output"
-                )
-    else:
-        if logger:
             logger.error(
-                f"Batch {batch_id}: Auto-repair failed - could not extract JSON"
+                f"Batch {batch_id}: Auto-repair failed - invalid JSON output"
             )
+    else:
+        logger.error(
+            f"Batch {batch_id}: Auto-repair failed - could not extract JSON"
+        )
 
     return None
 
 
 def repair_failed_batch(batch_content, batch_id):
     """Comprehensive repair attempt for a failed batch."""
-    global logger
-
     if not batch_content:
         return {}
 
-    if logger:
-        logger.info(f"Starting comprehensive repair for batch {batch_id}")
+    logger.info(f"Starting comprehensive repair for batch {batch_id}")
 
     # Try auto-repair first
     repair_result = attempt_auto_repair(batch_content, batch_id)
@@ -882,27 +1137,54 @@ def repair_failed_batch(batch_content, batch_id):
         return repair_result
 
     # Fallback: try the existing parsing methods
-    if logger:
-        logger.info(
-            f"Auto-repair failed for {batch_id}, trying fallback parsing")
+    logger.info(
+        f"Auto-repair failed for {batch_id}, trying fallback parsing")
 
     # Use existing split_translations_by_id function as fallback
     fallback_translations = split_translations_by_id(batch_content)
 
     if fallback_translations:
-        if logger:
-            logger.info(
-                f"Batch {batch_id}: Fallback parsing successful - extracted {len(fallback_translations)} translations"
-            )
+        logger.info(
+            f"Batch {batch_id}: Fallback parsing successful - extracted {len(fallback_translations)} translations"
+        )
         return fallback_translations
 
-    if logger:
-        logger.error(f"Batch {batch_id}: All repair attempts failed")
+    logger.error(f"Batch {batch_id}: All repair attempts failed")
     return {}
 
 
-def process_results(input_csv, output_jsonl, final_csv, batches):
-    """Process batch results and create final CSV."""
+def _csv_field(value):
+    """Quote a field the way csv.writer's default (excel) dialect does."""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _rows_with_duplicates(submitted_ids, pending_duplicates):
+    """Yield (description_id, source_id) for a batch's output rows in input order.
+
+    Submitted rows have no source_id (None); the repeated rows popped from
+    pending_duplicates follow the submitted row they come after in the input
+    and take the translation of their source row.
+    """
+    for desc_id in submitted_ids:
+        yield desc_id, None
+        yield from pending_duplicates.pop(desc_id, ())
+
+
+def process_results(input_csv,
+                    output_jsonl,
+                    final_csv,
+                    request_ids,
+                    english_by_id=None,
+                    duplicates=None):
+    """Process batch results and create final CSV.
+
+    request_ids, english_by_id and duplicates are as returned by
+    create_jsonl_from_csv; when english_by_id is omitted, input_csv is read
+    again to build it. Rows that repeat a submitted sentence are written at
+    their input position with the translation of their source row.
+    """
     logger.info(f"Processing results...")
 
     # Setup missing translations log file
@@ -912,45 +1194,82 @@ def process_results(input_csv, output_jsonl, final_csv, batches):
 
     logger.info(f"Missing translations will be logged to: {missing_log_file}")
 
-    # Load original data
-    with open(input_csv, encoding="utf-8") as f:
-        reader = csv.reader(f)
-        next(reader)
-        original_data = []
-        for row in reader:
-            if len(row) > 1 and row[1].strip():
-                description_id = row[0].strip()
-                sentence = row[1].strip()
-                original_data.append((description_id, sentence))
+    # Load original data unless the caller already has it
+    if english_by_id is None:
+        english_by_id = index_sentences_by_id(iter_input_rows(input_csv))
 
     # Parse model outputs
     model_outputs = parse_output_jsonl(output_jsonl)
     logger.info(f"Found {len(model_outputs)} batch responses")
 
-    # Create batch mapping
-    batch_mapping = {}
-    for i, batch_data in enumerate(batches, 1):
-        custom_id = f"batch-{i:04d}"
-        description_ids = [desc_id for desc_id, _ in batch_data]
-        batch_mapping[custom_id] = description_ids
+    # Repeated rows are written where they sit in the input, so the CSV keeps
+    # the input order; their source rows always come earlier
+    pending_duplicates = dict(duplicates or {})
+    repeated_sources = {
+        source_id
+        for rows in pending_duplicates.values() for _, source_id in rows
+    }
+    source_translations = {}
+    total_processed = 0
+
+    # Replies are independent, so parse them all up front; the CSV below is
+    # still written serially in batch order. The raw replies are dropped as
+    # soon as every batch is parsed.
+    replies = [model_outputs.pop(cid, None) for cid in request_ids]
+    del model_outputs
+    workers = min(PARSE_MAX_WORKERS, len(replies), os.cpu_count() or 1)
+    if (workers > 1 and sum(len(reply) for reply in replies if reply) >=
+            PARALLEL_SPLIT_MIN_CHARS):
+        # Parsing is pure CPU work, so large reply sets use processes to get
+        # past the GIL; their log messages are replayed here in batch order
+        parsed = []
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_split_worker) as executor:
+            for translations, records in executor.map(_split_reply_in_worker,
+                                                      replies,
+                                                      chunksize=16):
+                for level, message in records:
+                    logger.log(level, message)
+                parsed.append(translations)
+    else:
+        parsed = [split_translations_by_id(reply) for reply in replies]
+    del replies
 
     # Write final CSV and missing translations log
-    with open(final_csv, "w", newline="", encoding="utf-8-sig") as csvf, \
-         open(missing_log_file, 'w', encoding='utf-8') as missing_log:
+    with open(final_csv, "wb", buffering=CSV_WRITE_BUFFER_SIZE) as csvf, \
+         open(missing_log_file, 'w', encoding='utf-8',
+              buffering=CSV_WRITE_BUFFER_SIZE) as missing_log:
+
+        # Same bytes csv.writer would produce for utf-8-sig, without going
+        # through the generic writer for every row. Rows are collected per
+        # batch and encoded and written in one call.
+        csvf.write(b"\xef\xbb\xbf")
+        batch_lines = []
+
+        def write_row(row):
+            batch_lines.append(",".join(map(_csv_field, row)) + "\r\n")
+
+        def flush_rows():
+            csvf.write("".join(batch_lines).encode("utf-8"))
+            batch_lines.clear()
 
-        writer = csv.writer(csvf)
-        writer.writerow(
+        write_row(
             ["description_id", "english_sentence", "translated_sentence"])
+        flush_rows()
+        # Local aliases for the per-row loop below
+        is_suspicious = is_suspicious_translation
+        failed_marker = "[TRANSLATION_FAILED]"
 
         # Write missing translations log header
-        missing_log.write(f"Missing Translations Log\n")
-        missing_log.write(
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        missing_log.write(f"Input CSV: {input_csv}\n")
-        missing_log.write(f"Output CSV: {final_csv}\n")
-        missing_log.write(f"JSONL Source: {output_jsonl}\n")
-        missing_log.write(f"Total Batches: {len(batch_mapping)}\n")
-        missing_log.write("-" * 70 + "\n\n")
+        missing_log.writelines([
+            "Missing Translations Log\n",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"Input CSV: {input_csv}\n",
+            f"Output CSV: {final_csv}\n",
+            f"JSONL Source: {output_jsonl}\n",
+            f"Total Batches: {len(request_ids)}\n",
+            "-" * 70 + "\n\n",
+        ])
 
         all_failed = []
         all_extra = []
@@ -958,78 +1277,85 @@ def process_results(input_csv, output_jsonl, final_csv, batches):
         all_shifted = []
         all_suspicious = []
         missing_ids = []
+        # Missing-row entries are collected per batch and written at once
+        missing_lines = []
 
-        for custom_id, description_ids in batch_mapping.items():
+        for (custom_id, submitted_ids), translations in zip(
+                request_ids.items(), parsed):
             logger.info(f"Processing {custom_id}...")
-            translated_blob = model_outputs.get(custom_id)
-            translations = split_translations_by_id(translated_blob)
             logger.info(f"  Extracted {len(translations)} translations")
             missing = []
             extra = []
-            batch_rows = []
-
-            for description_id in description_ids:
-                english_sentence = next(
-                    (s for did, s in original_data if did == description_id),
-                    "")
-                translated_sentence = translations.get(description_id)
+            # Shift detection only looks at neighbouring rows, so keep the
+            # last two rows instead of the whole batch. Failed rows are
+            # always flagged suspicious. Repeated rows were not part of
+            # this request, so they are left out.
+            prev_row = None
+            before_prev_row = None
+
+            for description_id, source_id in _rows_with_duplicates(
+                    submitted_ids, pending_duplicates):
+                total_processed += 1
+                english_sentence = english_by_id.get(description_id, "")
+                if source_id is None:
+                    translated_sentence = translations.get(description_id)
+                    if description_id in repeated_sources:
+                        source_translations[
+                            description_id] = translated_sentence
+                else:
+                    translated_sentence = source_translations.get(source_id)
 
                 if translated_sentence is None:
-                    writer.writerow([
-                        description_id, english_sentence,
-                        "[TRANSLATION_FAILED]"
-                    ])
+                    write_row(
+                        [description_id, english_sentence, failed_marker])
                     missing.append((description_id, english_sentence))
                     missing_ids.append(description_id)
-                    batch_rows.append((description_id, english_sentence,
-                                       "[TRANSLATION_FAILED]"))
+                    row = (description_id, english_sentence, failed_marker,
+                           True)
 
                     # Log to missing translations file
-                    missing_log.write(
-                        f"No translation found for ID {description_id}\n")
-                    missing_log.write(f"  Batch: {custom_id}\n")
-                    missing_log.write(f"  English: {english_sentence}\n")
-                    missing_log.write(f"  Status: TRANSLATION_FAILED\n\n")
+                    missing_lines.append(
+                        f"No translation found for ID {description_id}\n"
+                        f"  Batch: {custom_id}\n"
+                        f"  English: {english_sentence}\n"
+                        f"  Status: TRANSLATION_FAILED\n\n")
                 else:
-                    writer.writerow([
+                    write_row([
                         description_id, english_sentence, translated_sentence
                     ])
                     all_success += 1
-                    batch_rows.append((description_id, english_sentence,
-                                       translated_sentence))
+                    suspicious = is_suspicious(translated_sentence)
+                    row = (description_id, english_sentence,
+                           translated_sentence, suspicious)
 
-                    if is_suspicious_translation(translated_sentence):
+                    if suspicious:
                         all_suspicious.append(
                             (custom_id, description_id, english_sentence,
                              translated_sentence))
 
+                if source_id is not None:
+                    continue
+                if prev_row is not None and prev_row[3] and not row[3]:
+                    all_shifted.append((custom_id, prev_row[0], prev_row[1],
+                                        row[0], row[2]))
+                before_prev_row, prev_row = prev_row, row
+
+            flush_rows()
+            if missing_lines:
+                missing_log.writelines(missing_lines)
+                missing_lines.clear()
+
             # Find extra translations
+            submitted_id_set = set(submitted_ids)
             for tid in translations:
-                if tid not in description_ids:
+                if tid not in submitted_id_set:
                     extra.append((tid, translations[tid]))
 
-            # Shift detection
-            for i in range(len(batch_rows) - 1):
-                curr_id, curr_eng, curr_trans = batch_rows[i]
-                next_id, next_eng, next_trans = batch_rows[i + 1]
-                if (curr_trans == "[TRANSLATION_FAILED]"
-                        or is_suspicious_translation(curr_trans)
-                    ) and next_trans not in (
-                        "[TRANSLATION_FAILED]", None,
-                        "") and not is_suspicious_translation(next_trans):
-                    all_shifted.append(
-                        (custom_id, curr_id, curr_eng, next_id, next_trans))
-
-            if batch_rows and (batch_rows[-1][2] == "[TRANSLATION_FAILED]"
-                               or is_suspicious_translation(
-                                   batch_rows[-1][2])) and len(batch_rows) > 1:
-                prev_id, prev_eng, prev_trans = batch_rows[-2]
-                if prev_trans not in (
-                        "[TRANSLATION_FAILED]", None,
-                        "") and not is_suspicious_translation(prev_trans):
-                    all_shifted.append(
-                        (custom_id, batch_rows[-1][0], batch_rows[-1][1],
-                         prev_id, prev_trans))
+            # A suspicious last row may have shifted into the row before it
+            if (before_prev_row is not None and prev_row[3]
+                    and not before_prev_row[3]):
+                all_shifted.append((custom_id, prev_row[0], prev_row[1],
+                                    before_prev_row[0], before_prev_row[2]))
 
             if missing:
                 logger.error(
@@ -1049,25 +1375,23 @@ def process_results(input_csv, output_jsonl, final_csv, batches):
                                   for tid, tval in extra])
 
         # Write summary to missing translations log
-        missing_log.write("-" * 70 + "\n")
-        missing_log.write("SUMMARY\n")
-        missing_log.write("-" * 70 + "\n")
-        missing_log.write(f"Total batches processed: {len(batch_mapping)}\n")
-        missing_log.write(f"Total rows processed: {len(original_data)}\n")
-        missing_log.write(f"Successful translations: {all_success}\n")
-        missing_log.write(f"Failed translations: {len(all_failed)}\n")
-        missing_log.write(
-            f"Success rate: {(all_success/len(original_data)*100):.1f}%\n"
-            if len(original_data) > 0 else "Success rate: N/A\n")
-        missing_log.write(
-            f"Missing IDs: {', '.join(missing_ids) if missing_ids else 'None'}\n"
-        )
-        missing_log.write(f"Extra translations: {len(all_extra)}\n")
-        missing_log.write(f"Suspicious translations: {len(all_suspicious)}\n")
-        missing_log.write(f"Shifted translations: {len(all_shifted)}\n")
+        missing_log.writelines([
+            "-" * 70 + "\n",
+            "SUMMARY\n",
+            "-" * 70 + "\n",
+            f"Total batches processed: {len(request_ids)}\n",
+            f"Total rows processed: {total_processed}\n",
+            f"Successful translations: {all_success}\n",
+            f"Failed translations: {len(all_failed)}\n",
+            f"Success rate: {(all_success/total_processed*100):.1f}%\n"
+            if total_processed > 0 else "Success rate: N/A\n",
+            f"Missing IDs: {', '.join(missing_ids) if missing_ids else 'None'}\n",
+            f"Extra translations: {len(all_extra)}\n",
+            f"Suspicious translations: {len(all_suspicious)}\n",
+            f"Shifted translations: {len(all_shifted)}\n",
+        ])
 
     # Print summary
-    total_processed = len(original_data)
     logger.info(f"\n=== TRANSLATION RESULTS ===")
     logger.info(f"Successful translations: {all_success}")
     logger.info(f"Failed translations: {len(all_failed)}")
@@ -1134,6 +1458,297 @@ def process_results(input_csv, output_jsonl, final_csv, batches):
             )
 
 
+def _new_analysis_results():
+    """Return an empty analysis_results dictionary."""
+    return {
+        'total_batches': 0,
+        'successful_batches': 0,
+        'failed_batches': 0,
+        'repaired_batches': 0,  # New: track auto-repairs
+        'json_parse_errors': [],
+        'missing_translations': [],
+        'suspicious_translations': [],
+        'empty_responses': [],
+        'partial_failures': [],
+        'status_code_errors': [],
+        'response_format_errors': [],
+        'repair_attempts': [],  # New: track repair attempts
+        'repair_successes': [],  # New: track successful repairs
+        'summary': {}
+    }
+
+
+def _merge_analysis_results(analysis_results, partial):
+    """Add the counts and detail lists of partial into analysis_results."""
+    for key, value in partial.items():
+        if isinstance(value, list):
+            analysis_results[key].extend(value)
+        elif isinstance(value, int):
+            analysis_results[key] += value
+
+
+_worker_original_data = None  # Set in analyze_jsonl_errors worker processes
+
+
+def _init_analyze_worker(original_data):
+    """Prepare a worker process started by analyze_jsonl_errors."""
+    global _worker_original_data
+    _worker_original_data = original_data
+    _init_split_worker()
+
+
+def _analyze_jsonl_chunk(jsonl_file_path, start, end, first_line_num,
+                         keep_repaired):
+    """Analyze the lines in a newline-aligned byte range in a worker.
+
+    Returns (partial analysis_results, analysis log messages, repaired
+    entry bytes, module log records) for the parent to merge in file order.
+    """
+    analysis_results = _new_analysis_results()
+    messages = []
+    repaired_entries = []
+    with closing(_iter_mapped_lines(jsonl_file_path, start, end)) as lines:
+        for line_num, line in enumerate(lines, first_line_num):
+            line = line.strip()
+            if not line:
+                continue
+            _analyze_jsonl_line(
+                line_num, line, _worker_original_data, analysis_results,
+                messages.append,
+                repaired_entries.append if keep_repaired else None)
+    records = _worker_log_buffer.records
+    _worker_log_buffer.records = []
+    return analysis_results, messages, repaired_entries, records
+
+
+def _analyze_jsonl_line(line_num, line, original_data, analysis_results,
+                        log_error, save_repaired):
+    """Analyze one non-blank output JSONL line (bytes) into analysis_results.
+
+    save_repaired receives the bytes of each entry for the repaired JSONL,
+    or is None when no repaired file is written.
+    """
+    analysis_results['total_batches'] += 1
+    custom_id = f"Unknown_Batch_{line_num}"
+    current_entry = None
+
+    try:
+        # Parse the JSONL line
+        item = orjson.loads(line)
+        custom_id = item.get('custom_id', custom_id)
+
+        # Check for HTTP status code errors
+        if 'response' in item:
+            status_code = item['response'].get('status_code')
+            if status_code != 200:
+                error_info = {
+                    'batch_id':
+                    custom_id,
+                    'status_code':
+                    status_code,
+                    'line_number':
+                    line_num,
+                    'error_details':
+                    item.get('error', 'Unknown error')
+                }
+                analysis_results['status_code_errors'].append(
+                    error_info)
+                log_error(
+                    f"HTTP Error in {custom_id}: Status {status_code}"
+                )
+                return
+
+        # Extract content from response
+        try:
+            content = item["response"]["body"]["choices"][0][
+                "message"]["content"]
+        except KeyError as e:
+            error_info = {
+                'batch_id': custom_id,
+                'line_number': line_num,
+                'missing_key': str(e),
+                'available_keys': list(item.keys())
+            }
+            analysis_results['response_format_errors'].append(
+                error_info)
+            log_error(
+                f"Response format error in {custom_id}: Missing key {e}"
+            )
+            return
+
+        # Check for empty responses
+        if not content or not content.strip():
+            error_info = {
+                'batch_id': custom_id,
+                'line_number': line_num,
+                'content': content
+            }
+            analysis_results['empty_responses'].append(
+                error_info)
+            log_error(f"Empty response in {custom_id}")
+            return
+
+        # Parse the reply the same way process_results does, falling back
+        # to line parsing when the JSON holds no usable translations
+        translations = _json_reply_translations(content, log_attempts=False)
+        if not translations:
+            translations = _fallback_line_parsing(
+                content, warn_unmatched=False)
+
+        # === AUTO-REPAIR LOGIC ===
+        if not translations and AUTO_REPAIR_ENABLED:
+            # Detect if this might be a truncation issue
+            if detect_truncation_issues(content):
+                log_error(
+                    f"Truncation detected in {custom_id}, attempting auto-repair..."
+                )
+
+                repair_info = {
+                    'batch_id': custom_id,
+                    'line_number': line_num,
+                    'repair_trigger': 'truncation_detected',
+                    'original_content_length': len(content)
+                }
+                analysis_results['repair_attempts'].append(
+                    repair_info)
+
+                # Attempt repair
+                repaired_translations = repair_failed_batch(
+                    content, custom_id)
+
+                if repaired_translations:
+                    translations = repaired_translations
+                    analysis_results['repaired_batches'] += 1
+
+                    # Update repair info with success
+                    repair_success = {
+                        'batch_id':
+                        custom_id,
+                        'line_number':
+                        line_num,
+                        'translations_recovered':
+                        len(repaired_translations),
+                        'repair_method':
+                        'auto_truncation_fix'
+                    }
+                    analysis_results[
+                        'repair_successes'].append(
+                            repair_success)
+
+                    # If we have a repaired entry, update the content for backup
+                    if save_repaired is not None:
+                        # Create clean JSON content for the repaired entry
+                        clean_json = orjson.dumps(
+                            repaired_translations).decode(
+                                "utf-8")
+                        item["response"]["body"]["choices"][
+                            0]["message"][
+                                "content"] = clean_json
+                        current_entry = orjson.dumps(item)
+                        save_repaired(current_entry)
+
+                    log_error(
+                        f"AUTO-REPAIR SUCCESS: {custom_id} - recovered {len(repaired_translations)} translations"
+                    )
+                else:
+                    log_error(
+                        f"AUTO-REPAIR FAILED: {custom_id} - could not recover translations"
+                    )
+
+        if not translations:
+            # JSON parsing failed completely
+            error_info = {
+                'batch_id':
+                custom_id,
+                'line_number':
+                line_num,
+                'content_preview':
+                content[:200] +
+                "..." if len(content) > 200 else content,
+                'content_length':
+                len(content),
+                'parse_error':
+                'Failed to extract any translations',
+                'truncation_detected':
+                detect_truncation_issues(content)
+            }
+            analysis_results['json_parse_errors'].append(
+                error_info)
+            log_error(
+                f"JSON parse failure in {custom_id}: No translations extracted"
+            )
+            analysis_results['failed_batches'] += 1
+        else:
+            # Partial success - analyze what was extracted
+            analysis_results['successful_batches'] += 1
+
+            # Check for suspicious translations
+            suspicious_count = 0
+            for desc_id, translation in translations.items():
+                if is_suspicious_translation(translation):
+                    suspicious_count += 1
+                    error_info = {
+                        'batch_id':
+                        custom_id,
+                        'description_id':
+                        desc_id,
+                        'translation':
+                        translation,
+                        'original_text':
+                        original_data.get(desc_id, 'Unknown'),
+                        'reason':
+                        'Suspicious translation pattern'
+                    }
+                    analysis_results[
+                        'suspicious_translations'].append(
+                            error_info)
+
+            if suspicious_count > 0:
+                log_error(
+                    f"Found {suspicious_count} suspicious translations in {custom_id}"
+                )
+
+            log_error(
+                f"Batch {custom_id}: Extracted {len(translations)} translations, {suspicious_count} suspicious"
+            )
+
+            # Add successful entry to repaired file (even if not repaired)
+            if save_repaired is not None:
+                # Unrepaired entries are copied verbatim
+                save_repaired(current_entry
+                              if current_entry is not None
+                              else line)
+
+    except json.JSONDecodeError as e:
+        line = line.decode('utf-8', 'replace')
+        error_info = {
+            'batch_id':
+            custom_id,
+            'line_number':
+            line_num,
+            'json_error':
+            str(e),
+            'content_preview':
+            line[:200] + "..." if len(line) > 200 else line
+        }
+        analysis_results['json_parse_errors'].append(
+            error_info)
+        log_error(f"JSON decode error at line {line_num}: {e}")
+        analysis_results['failed_batches'] += 1
+
+    except Exception as e:
+        error_info = {
+            'batch_id': custom_id,
+            'line_number': line_num,
+            'unexpected_error': str(e),
+            'error_type': type(e).__name__
+        }
+        analysis_results['response_format_errors'].append(
+            error_info)
+        log_error(f"Unexpected error at line {line_num}: {e}")
+        analysis_results['failed_batches'] += 1
+
+
 def analyze_jsonl_errors(jsonl_file_path,
                          input_csv_path=None,
                          error_log_path=None):
@@ -1151,10 +1766,12 @@ def analyze_jsonl_errors(jsonl_file_path,
         Dictionary containing error analysis results
     """
 
+    jsonl_path = Path(jsonl_file_path)
+
     # Setup error log file
     if error_log_path is None:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        jsonl_stem = Path(jsonl_file_path).stem
+        jsonl_stem = jsonl_path.stem
         error_log_path = f"error_analysis_{jsonl_stem}_{timestamp}.log"
 
     # Create error log directory if needed
@@ -1163,33 +1780,14 @@ def analyze_jsonl_errors(jsonl_file_path,
         error_log_dir.mkdir(exist_ok=True)
 
     # Initialize analysis results
-    analysis_results = {
-        'total_batches': 0,
-        'successful_batches': 0,
-        'failed_batches': 0,
-        'repaired_batches': 0,  # New: track auto-repairs
-        'json_parse_errors': [],
-        'missing_translations': [],
-        'suspicious_translations': [],
-        'empty_responses': [],
-        'partial_failures': [],
-        'status_code_errors': [],
-        'response_format_errors': [],
-        'repair_attempts': [],  # New: track repair attempts
-        'repair_successes': [],  # New: track successful repairs
-        'summary': {}
-    }
+    analysis_results = _new_analysis_results()
 
     # Load original input data if provided
     original_data = {}
     if input_csv_path and Path(input_csv_path).exists():
         try:
-            with open(input_csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                next(reader, None)  # Skip header
-                for row in reader:
-                    if len(row) >= 2:
-                        original_data[row[0].strip()] = row[1].strip()
+            original_data = index_sentences_by_id(
+                iter_input_rows(input_csv_path))
         except Exception as e:
             print(f"Warning: Could not load input CSV: {e}")
 
@@ -1200,13 +1798,22 @@ def analyze_jsonl_errors(jsonl_file_path,
                                                       '_repaired.jsonl')
 
     # Start error analysis log
-    with open(error_log_path, 'w', encoding='utf-8') as error_log:
+    with open(error_log_path, 'w', encoding='utf-8',
+              buffering=1 << 16) as error_log:
 
         def log_error(message):
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
             error_log.write(f"[{timestamp}] {message}\n")
             print(f"ERROR ANALYSIS: {message}")
 
+        def log_errors(messages):
+            """Log several messages with one timestamp and a single write."""
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            error_log.write("".join(f"[{timestamp}] {message}\n"
+                                    for message in messages))
+            print("\n".join(f"ERROR ANALYSIS: {message}"
+                            for message in messages))
+
         log_error("=== JSONL ERROR ANALYSIS WITH AUTO-REPAIR STARTED ===")
         log_error(f"Analyzing file: {jsonl_file_path}")
         if input_csv_path:
@@ -1216,290 +1823,87 @@ def analyze_jsonl_errors(jsonl_file_path,
         log_error("")
 
         # Check if JSONL file exists
-        if not Path(jsonl_file_path).exists():
+        if not jsonl_path.exists():
             log_error(f"CRITICAL: JSONL file not found: {jsonl_file_path}")
             analysis_results['summary'][
                 'critical_error'] = f"File not found: {jsonl_file_path}"
             return analysis_results
 
-        # Prepare repaired JSONL file if needed
-        repaired_entries = []
+        # Repaired JSONL entries are streamed to disk as they are accepted;
+        # the file is only created once there is something to write
+        repaired_file = None
+        repaired_count = 0
+
+        repaired_write_failed = False
+
+        def save_repaired(entry_bytes):
+            nonlocal repaired_file, repaired_count, repaired_write_failed
+            if repaired_write_failed:
+                return
+            try:
+                if repaired_file is None:
+                    repaired_file = open(repaired_jsonl_path,
+                                         'wb',
+                                         buffering=JSONL_WRITE_BUFFER_SIZE)
+                repaired_file.write(entry_bytes)
+                repaired_file.write(b"\n")
+                repaired_count += 1
+            except Exception as e:
+                repaired_write_failed = True
+                log_error(f"Failed to write repaired JSONL: {e}")
 
         # Analyze each line in JSONL
         try:
-            with open(jsonl_file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    analysis_results['total_batches'] += 1
-                    custom_id = f"Unknown_Batch_{line_num}"
-                    current_entry = None
-
-                    try:
-                        # Parse the JSONL line
-                        item = json.loads(line)
-                        custom_id = item.get('custom_id', custom_id)
-                        current_entry = item.copy()  # Keep original for repair
-
-                        # Check for HTTP status code errors
-                        if 'response' in item:
-                            status_code = item['response'].get('status_code')
-                            if status_code != 200:
-                                error_info = {
-                                    'batch_id':
-                                    custom_id,
-                                    'status_code':
-                                    status_code,
-                                    'line_number':
-                                    line_num,
-                                    'error_details':
-                                    item.get('error', 'Unknown error')
-                                }
-                                analysis_results['status_code_errors'].append(
-                                    error_info)
-                                log_error(
-                                    f"HTTP Error in {custom_id}: Status {status_code}"
-                                )
-                                continue
-
-                        # Extract content from response
-                        try:
-                            content = item["response"]["body"]["choices"][0][
-                                "message"]["content"]
-                        except KeyError as e:
-                            error_info = {
-                                'batch_id': custom_id,
-                                'line_number': line_num,
-                                'missing_key': str(e),
-                                'available_keys': list(item.keys())
-                            }
-                            analysis_results['response_format_errors'].append(
-                                error_info)
-                            log_error(
-                                f"Response format error in {custom_id}: Missing key {e}"
-                            )
-                            continue
-
-                        # Check for empty responses
-                        if not content or not content.strip():
-                            error_info = {
-                                'batch_id': custom_id,
-                                'line_number': line_num,
-                                'content': content
-                            }
-                            analysis_results['empty_responses'].append(
-                                error_info)
-                            log_error(f"Empty response in {custom_id}")
+            workers = min(PARSE_MAX_WORKERS, os.cpu_count() or 1)
+            if (workers > 1 and
+                    jsonl_path.stat().st_size >= PARALLEL_PARSE_MIN_BYTES):
+                # Lines are independent, so large files are analyzed in
+                # processes over newline-aligned byte ranges; the parent
+                # merges results and writes logs and repairs in file order
+                chunks = _line_aligned_chunks(jsonl_file_path,
+                                              ANALYZE_CHUNK_BYTES)
+                keep_repaired = repaired_jsonl_path is not None
+                with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_analyze_worker,
+                        initargs=(original_data, )) as executor:
+                    for partial, messages, entries, records in executor.map(
+                            _analyze_jsonl_chunk,
+                        [jsonl_file_path] * len(chunks), *zip(*chunks),
+                        [keep_repaired] * len(chunks)):
+                        _merge_analysis_results(analysis_results, partial)
+                        for message in messages:
+                            log_error(message)
+                        for level, message in records:
+                            logger.log(level, message)
+                        for entry in entries:
+                            save_repaired(entry)
+            else:
+                with closing(_iter_mapped_lines(jsonl_file_path)) as lines:
+                    for line_num, line in enumerate(lines, 1):
+                        line = line.strip()
+                        if not line:
                             continue
 
-                        # Try to parse translations from content using local parsing
-                        translations = {}
-
-                        # Try JSON parsing first (modified from split_translations_by_id without logger)
-                        for strategy_num, cleanup_func in enumerate([
-                                _cleanup_markdown_basic,
-                                _cleanup_markdown_aggressive,
-                                _cleanup_markdown_multiline,
-                                _cleanup_unicode_and_escapes
-                        ], 1):
-                            try:
-                                cleaned_blob = cleanup_func(content)
-                                if not cleaned_blob:
-                                    continue
-
-                                # Try to parse as JSON
-                                json_data = json.loads(cleaned_blob)
-                                if isinstance(json_data, dict) and json_data:
-                                    # Direct JSON mapping - this is what we want
-                                    for desc_id, translation in json_data.items(
-                                    ):
-                                        if translation and str(
-                                                translation).strip():
-                                            clean_translation = str(
-                                                translation).strip()
-                                            if not is_suspicious_translation(
-                                                    clean_translation):
-                                                translations[
-                                                    str(desc_id
-                                                        )] = clean_translation
-                                    break
-                            except json.JSONDecodeError:
-                                continue
-                            except Exception:
-                                continue
-
-                        # If JSON parsing failed, try fallback
-                        if not translations:
-                            translations = _fallback_line_parsing_no_logger(
-                                content)
-
-                        # === AUTO-REPAIR LOGIC ===
-                        if not translations and AUTO_REPAIR_ENABLED:
-                            # Detect if this might be a truncation issue
-                            if detect_truncation_issues(content):
-                                log_error(
-                                    f"Truncation detected in {custom_id}, attempting auto-repair..."
-                                )
-
-                                repair_info = {
-                                    'batch_id': custom_id,
-                                    'line_number': line_num,
-                                    'repair_trigger': 'truncation_detected',
-                                    'original_content_length': len(content)
-                                }
-                                analysis_results['repair_attempts'].append(
-                                    repair_info)
-
-                                # Attempt repair
-                                repaired_translations = repair_failed_batch(
-                                    content, custom_id)
-
-                                if repaired_translations:
-                                    translations = repaired_translations
-                                    analysis_results['repaired_batches'] += 1
-
-                                    # Update repair info with success
-                                    repair_success = {
-                                        'batch_id':
-                                        custom_id,
-                                        'line_number':
-                                        line_num,
-                                        'translations_recovered':
-                                        len(repaired_translations),
-                                        'repair_method':
-                                        'auto_truncation_fix'
-                                    }
-                                    analysis_results[
-                                        'repair_successes'].append(
-                                            repair_success)
-
-                                    # If we have a repaired entry, update the content for backup
-                                    if current_entry and repaired_jsonl_path:
-                                        # Create clean JSON content for the repaired entry
-                                        clean_json = json.dumps(
-                                            repaired_translations,
-                                            ensure_ascii=False,
-                                            separators=(',', ': '))
-                                        current_entry["response"]["body"][
-                                            "choices"][0]["message"][
-                                                "content"] = clean_json
-                                        repaired_entries.append(current_entry)
-
-                                    log_error(
-                                        f"AUTO-REPAIR SUCCESS: {custom_id} - recovered {len(repaired_translations)} translations"
-                                    )
-                                else:
-                                    log_error(
-                                        f"AUTO-REPAIR FAILED: {custom_id} - could not recover translations"
-                                    )
-
-                        if not translations:
-                            # JSON parsing failed completely
-                            error_info = {
-                                'batch_id':
-                                custom_id,
-                                'line_number':
-                                line_num,
-                                'content_preview':
-                                content[:200] +
-                                "..." if len(content) > 200 else content,
-                                'content_length':
-                                len(content),
-                                'parse_error':
-                                'Failed to extract any translations',
-                                'truncation_detected':
-                                detect_truncation_issues(content)
-                            }
-                            analysis_results['json_parse_errors'].append(
-                                error_info)
-                            log_error(
-                                f"JSON parse failure in {custom_id}: No translations extracted"
-                            )
-                            analysis_results['failed_batches'] += 1
-                        else:
-                            # Partial success - analyze what was extracted
-                            analysis_results['successful_batches'] += 1
-
-                            # Check for suspicious translations
-                            suspicious_count = 0
-                            for desc_id, translation in translations.items():
-                                if is_suspicious_translation(translation):
-                                    suspicious_count += 1
-                                    error_info = {
-                                        'batch_id':
-                                        custom_id,
-                                        'description_id':
-                                        desc_id,
-                                        'translation':
-                                        translation,
-                                        'original_text':
-                                        original_data.get(desc_id, 'Unknown'),
-                                        'reason':
-                                        'Suspicious translation pattern'
-                                    }
-                                    analysis_results[
-                                        'suspicious_translations'].append(
-                                            error_info)
-
-                            if suspicious_count > 0:
-                                log_error(
-                                    f"Found {suspicious_count} suspicious translations in {custom_id}"
-                                )
-
-                            log_error(
-                                f"Batch {custom_id}: Extracted {len(translations)} translations, {suspicious_count} suspicious"
-                            )
-
-                            # Add successful entry to repaired file (even if not repaired)
-                            if repaired_jsonl_path:
-                                repaired_entries.append(current_entry)
-
-                    except json.JSONDecodeError as e:
-                        error_info = {
-                            'batch_id':
-                            custom_id,
-                            'line_number':
-                            line_num,
-                            'json_error':
-                            str(e),
-                            'content_preview':
-                            line[:200] + "..." if len(line) > 200 else line
-                        }
-                        analysis_results['json_parse_errors'].append(
-                            error_info)
-                        log_error(f"JSON decode error at line {line_num}: {e}")
-                        analysis_results['failed_batches'] += 1
-
-                    except Exception as e:
-                        error_info = {
-                            'batch_id': custom_id,
-                            'line_number': line_num,
-                            'unexpected_error': str(e),
-                            'error_type': type(e).__name__
-                        }
-                        analysis_results['response_format_errors'].append(
-                            error_info)
-                        log_error(f"Unexpected error at line {line_num}: {e}")
-                        analysis_results['failed_batches'] += 1
+                        _analyze_jsonl_line(
+                            line_num, line, original_data, analysis_results,
+                            log_error,
+                            save_repaired if repaired_jsonl_path else None)
 
         except Exception as e:
             log_error(f"CRITICAL: Could not read JSONL file: {e}")
             analysis_results['summary']['critical_error'] = str(e)
             return analysis_results
+        finally:
+            if repaired_file is not None:
+                try:
+                    repaired_file.close()
+                except Exception as e:
+                    repaired_write_failed = True
+                    log_error(f"Failed to write repaired JSONL: {e}")
 
-        # Write repaired JSONL file if we have repairs
-        if repaired_entries and repaired_jsonl_path:
-            try:
-                with open(repaired_jsonl_path, 'w',
-                          encoding='utf-8') as repaired_file:
-                    for entry in repaired_entries:
-                        repaired_file.write(
-                            json.dumps(entry, ensure_ascii=False) + '\n')
-                log_error(f"Repaired JSONL written to: {repaired_jsonl_path}")
-            except Exception as e:
-                log_error(f"Failed to write repaired JSONL: {e}")
+        if repaired_count and not repaired_write_failed:
+            log_error(f"Repaired JSONL written to: {repaired_jsonl_path}")
 
         # Generate summary
         total = analysis_results['total_batches']
@@ -1542,84 +1946,90 @@ def analyze_jsonl_errors(jsonl_file_path,
             len(analysis_results['repair_successes'])
         }
 
-        log_error("")
-        log_error("=== ANALYSIS SUMMARY ===")
-        log_error(f"Total batches analyzed: {total}")
-        log_error(f"Successful batches: {successful}")
-        log_error(f"Failed batches: {failed}")
-        log_error(f"Auto-repaired batches: {repaired}")
-        log_error(f"Original success rate: {success_rate:.2f}%")
-        log_error(f"Repair success rate: {repair_rate:.2f}%")
-        log_error(
+        # The summary is written to the log in one go
+        summary_lines = []
+        summary_lines.append("")
+        summary_lines.append("=== ANALYSIS SUMMARY ===")
+        summary_lines.append(f"Total batches analyzed: {total}")
+        summary_lines.append(f"Successful batches: {successful}")
+        summary_lines.append(f"Failed batches: {failed}")
+        summary_lines.append(f"Auto-repaired batches: {repaired}")
+        summary_lines.append(f"Original success rate: {success_rate:.2f}%")
+        summary_lines.append(f"Repair success rate: {repair_rate:.2f}%")
+        summary_lines.append(
             f"Effective success rate: {((successful + repaired) / total * 100) if total > 0 else 0:.2f}%"
         )
-        log_error(
+        summary_lines.append(
             f"JSON parse errors: {len(analysis_results['json_parse_errors'])}")
-        log_error(
+        summary_lines.append(
             f"Suspicious translations: {len(analysis_results['suspicious_translations'])}"
         )
-        log_error(
+        summary_lines.append(
             f"Empty responses: {len(analysis_results['empty_responses'])}")
-        log_error(
+        summary_lines.append(
             f"HTTP status errors: {len(analysis_results['status_code_errors'])}"
         )
-        log_error(
+        summary_lines.append(
             f"Response format errors: {len(analysis_results['response_format_errors'])}"
         )
-        log_error(
+        summary_lines.append(
             f"Repair attempts: {len(analysis_results['repair_attempts'])}")
-        log_error(
+        summary_lines.append(
             f"Successful repairs: {len(analysis_results['repair_successes'])}")
-        log_error("")
+        summary_lines.append("")
 
         # Detailed error breakdown
         if analysis_results['json_parse_errors']:
-            log_error("=== JSON PARSE ERRORS DETAILS ===")
+            summary_lines.append("=== JSON PARSE ERRORS DETAILS ===")
             for error in analysis_results[
                     'json_parse_errors'][:10]:  # Show first 10
-                log_error(
+                summary_lines.append(
                     f"Batch: {error['batch_id']}, Line: {error['line_number']}"
                 )
-                log_error(
+                summary_lines.append(
                     f"  Error: {error.get('json_error', error.get('parse_error', 'Unknown'))}"
                 )
-                log_error(
+                summary_lines.append(
                     f"  Truncation detected: {error.get('truncation_detected', 'Unknown')}"
                 )
-                log_error(
+                summary_lines.append(
                     f"  Preview: {error.get('content_preview', 'N/A')[:100]}..."
                 )
-                log_error("")
+                summary_lines.append("")
 
         if analysis_results['repair_successes']:
-            log_error("=== SUCCESSFUL REPAIRS DETAILS ===")
+            summary_lines.append("=== SUCCESSFUL REPAIRS DETAILS ===")
             for repair in analysis_results[
                     'repair_successes'][:10]:  # Show first 10
-                log_error(
+                summary_lines.append(
                     f"Batch: {repair['batch_id']}, Line: {repair['line_number']}"
                 )
-                log_error(f"  Method: {repair['repair_method']}")
-                log_error(
+                summary_lines.append(f"  Method: {repair['repair_method']}")
+                summary_lines.append(
                     f"  Translations recovered: {repair['translations_recovered']}"
                 )
-                log_error("")
+                summary_lines.append("")
 
         if analysis_results['suspicious_translations']:
-            log_error("=== SUSPICIOUS TRANSLATIONS DETAILS ===")
+            summary_lines.append("=== SUSPICIOUS TRANSLATIONS DETAILS ===")
             for error in analysis_results[
                     'suspicious_translations'][:10]:  # Show first 10
-                log_error(
+                summary_lines.append(
                     f"Batch: {error['batch_id']}, ID: {error['description_id']}"
                 )
-                log_error(f"  Original: {error['original_text'][:100]}...")
-                log_error(f"  Translation: {error['translation']}")
-                log_error(f"  Reason: {error['reason']}")
-                log_error("")
-
-        log_error("=== ERROR ANALYSIS WITH AUTO-REPAIR COMPLETED ===")
-        log_error(f"Detailed results saved to: {error_log_path}")
-        if repaired_jsonl_path and repaired_entries:
-            log_error(f"Repaired JSONL saved to: {repaired_jsonl_path}")
+                summary_lines.append(
+                    f"  Original: {error['original_text'][:100]}...")
+                summary_lines.append(f"  Translation: {error['translation']}")
+                summary_lines.append(f"  Reason: {error['reason']}")
+                summary_lines.append("")
+
+        summary_lines.append(
+            "=== ERROR ANALYSIS WITH AUTO-REPAIR COMPLETED ===")
+        summary_lines.append(f"Detailed results saved to: {error_log_path}")
+        if repaired_jsonl_path and repaired_count:
+            summary_lines.append(
+                f"Repaired JSONL saved to: {repaired_jsonl_path}")
+        log_errors(summary_lines)
 
     print(f"\nError analysis with auto-repair completed!")
     print(f"Total batches: {total}")
@@ -1630,7 +2040,7 @@ def analyze_jsonl_errors(jsonl_file_path,
             f"Effective success rate: {((successful + repaired) / total * 100) if total > 0 else 0:.2f}%"
         )
     print(f"Detailed error log saved to: {error_log_path}")
-    if repaired_jsonl_path and repaired_entries:
+    if repaired_jsonl_path and repaired_count:
         print(f"Repaired JSONL saved to: {repaired_jsonl_path}")
 
     return analysis_results
@@ -1640,7 +2050,7 @@ def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print(
-            "  Translation: python auto_translate.py <input_csv> <target_language> <output_csv>"
+            "  Translation: python auto_translate.py <input_csv> <target_language[,language...]> <output_csv>"
         )
         print(
             "  Error Analysis: python auto_translate.py analyze <jsonl_file> [input_csv]"
@@ -1649,6 +2059,9 @@ def main():
         print("Examples:")
         print(
             "  python auto_translate.py test_input.csv Hindi translations.csv")
+        print(
+            "  python auto_translate.py test_input.csv Hindi,Telugu translations.csv"
+        )
         print("  python auto_translate.py analyze output.jsonl")
         print("  python auto_translate.py analyze output.jsonl input.csv")
         sys.exit(1)
@@ -1745,12 +2158,30 @@ def main():
 
     # Extract arguments for translation
     input_csv = sys.argv[1]
-    target_language = sys.argv[2]
+    target_languages = [
+        language.strip() for language in sys.argv[2].split(",")
+        if language.strip()
+    ]
     output_csv = sys.argv[3]
 
+    if not target_languages:
+        print("Error: No target language given")
+        print(
+            "Usage: python auto_translate.py <input_csv> <target_language[,language...]> <output_csv>"
+        )
+        print(
+            "Example: python auto_translate.py test_input.csv Hindi,Telugu translations.csv"
+        )
+        sys.exit(1)
+
     # Add error handling for the translation pipeline
     try:
-        run_translation_pipeline(input_csv, target_language, output_csv)
+        if len(target_languages) > 1:
+            run_multi_language_pipeline(input_csv, target_languages,
+                                        output_csv)
+        else:
+            run_translation_pipeline(input_csv, target_languages[0],
+                                     output_csv)
     except Exception as e:
         print(f"Error during translation: {e}")
         import traceback
@@ -1758,41 +2189,13 @@ def main():
         sys.exit(1)
 
 
-def run_translation_pipeline(input_csv, target_language, output_csv):
-    """Execute the full translation pipeline."""
-    global logger
-
-    # Create unique file names based on input file
-    input_stem = Path(input_csv).stem
-    timestamp = int(time.time())
-    unique_id = f"{input_stem}_{timestamp}"
-
-    # Initialize logging
-    log_filename = f"translation_log_{unique_id}.txt"
-    log_path = setup_logging(log_filename)
-    logger = DualLogger(log_path)
-
-    logger.info("=== TRANSLATION PIPELINE STARTED ===")
-    logger.info(f"Input CSV: {input_csv}")
-    logger.info(f"Target Language: {target_language}")
-    logger.info(f"Output CSV: {output_csv}")
-    logger.info(f"Unique ID: {unique_id}")
-    logger.info(f"Log file: {log_path}")
-
-    # Initialize batch tracking
-    initialize_batch_tracking()
-
-    # Unique file names
-    jsonl_file = f"{unique_id}_batch.jsonl"
-    output_jsonl = f"{unique_id}_output.jsonl"
-    error_jsonl = f"{unique_id}_errors.jsonl"
-
-    # Step 1: Create JSONL from CSV
-    logger.info("=== Step 1: Creating JSONL from CSV ===")
-    batches = create_jsonl_from_csv(input_csv, jsonl_file, target_language)
-
+def submit_translation_job(jsonl_file, input_csv, target_language,
+                           output_csv, unique_id, timestamp):
+    """Upload the batch JSONL for one language and start the batch job."""
     # Step 2: Upload and create batch job
-    logger.info("\n=== Step 2: Uploading and creating batch job ===")
+    logger.info(
+        f"\n=== Step 2: Uploading and creating batch job ({target_language}) ==="
+    )
     input_file_id = upload_batch_file(jsonl_file)
     job = create_batch_job(input_file_id)
     job_id = job.id
@@ -1813,9 +2216,113 @@ def run_translation_pipeline(input_csv, target_language, output_csv):
     logger.info(f"Unique ID: {unique_id}")
     logger.info(f"{'='*50}")
 
+    return job
+
+
+def run_direct_job(jsonl_file, input_csv, target_language, output_csv,
+                   unique_id, timestamp, batch_info):
+    """Translate a small input with direct requests instead of a batch job.
+
+    Returns (status, job_id), where job_id is the direct_ ID the run is
+    tracked under.
+    """
+    job_id = f"direct_{unique_id}"
+    output_jsonl = f"{unique_id}_output.jsonl"
+
+    logger.info(
+        f"\n=== Step 2: Sending requests directly ({target_language}) ===")
+    add_batch_record(batch_id=unique_id,
+                     input_file=input_csv,
+                     job_id=job_id,
+                     status="in_progress",
+                     timestamp=timestamp,
+                     target_language=target_language,
+                     output_file=output_csv)
+
+    failed = run_direct_requests(jsonl_file, output_jsonl)
+    if failed == len(batch_info[0]):
+        logger.error(f"All requests failed! Check {output_jsonl} for details")
+        update_batch_status(job_id, "failed")
+        logger.error("=== TRANSLATION PIPELINE FAILED ===")
+        return "failed", job_id
+    if failed:
+        logger.warning(
+            f"{failed} requests failed. Check {output_jsonl} for details")
+
+    logger.info("\n=== Step 4: Processing results ===")
+    process_results(input_csv, output_jsonl, output_csv, *batch_info)
+
+    # Rows of the failed requests are marked [TRANSLATION_FAILED]
+    status = "partial" if failed else "completed"
+    update_batch_status(job_id, status, output_csv)
+
+    logger.info(f"\n[+] Pipeline complete! Final translations in: {output_csv}")
+    if failed:
+        logger.warning(
+            "=== TRANSLATION PIPELINE COMPLETED WITH FAILED REQUESTS ===")
+    else:
+        logger.info("=== TRANSLATION PIPELINE COMPLETED SUCCESSFULLY ===")
+    return status, job_id
+
+
+def start_language_job(input_csv, target_language, output_csv, unique_id,
+                       timestamp):
+    """Create the batch JSONL for one language and start translating it.
+
+    Inputs of up to DIRECT_MAX_BATCHES batches are sent as direct chat
+    completion requests, which return in seconds; larger inputs go through
+    the Batch API. Returns (status, job_id, job, batch_info), where job is
+    None if the language was already finished with direct requests.
+    """
+    jsonl_file = f"{unique_id}_batch.jsonl"
+
+    # Step 1: Create JSONL from CSV
+    logger.info(f"=== Step 1: Creating JSONL from CSV ({target_language}) ===")
+    batch_info = create_jsonl_from_csv(input_csv, jsonl_file, target_language)
+
+    if len(batch_info[0]) <= DIRECT_MAX_BATCHES:
+        status, job_id = run_direct_job(jsonl_file, input_csv,
+                                        target_language, output_csv,
+                                        unique_id, timestamp, batch_info)
+        return status, job_id, None, batch_info
+
+    job = submit_translation_job(jsonl_file, input_csv, target_language,
+                                 output_csv, unique_id, timestamp)
+    return job.status, job.id, job, batch_info
+
+
+def translate_language(input_csv, target_language, output_csv, unique_id,
+                       timestamp):
+    """Translate input_csv into one language.
+
+    Returns (status, job_id) with the final status recorded for the job;
+    job_id is the direct_ ID if the language was finished with direct
+    requests.
+    """
+    status, job_id, job, batch_info = start_language_job(
+        input_csv, target_language, output_csv, unique_id, timestamp)
+    if job is None:
+        return status, job_id
+
     # Step 3: Wait for completion
     logger.info("\n=== Step 3: Waiting for job completion ===")
-    job = poll_until_done(job_id)
+    job = poll_until_done(job.id)
+
+    status = finish_translation_job(job, input_csv, output_csv, unique_id,
+                                    batch_info)
+    return status, job.id
+
+
+def finish_translation_job(job, input_csv, output_csv, unique_id, batch_info):
+    """Download and process the results of a batch job in a terminal status.
+
+    batch_info is the tuple returned by create_jsonl_from_csv. Returns the
+    final status recorded for the job, e.g. "completed" or "download_failed".
+    """
+    job_id = job.id
+    error_file_id = getattr(job, 'error_file_id', None)
+    output_jsonl = f"{unique_id}_output.jsonl"
+    error_jsonl = f"{unique_id}_errors.jsonl"
 
     # Update batch status
     update_batch_status(job_id, job.status)
@@ -1826,12 +2333,13 @@ def run_translation_pipeline(input_csv, target_language, output_csv):
         # Download results
         if download_file(job.output_file_id, output_jsonl):
             # Download errors if they exist
-            if hasattr(job, 'error_file_id') and job.error_file_id:
-                download_file(job.error_file_id, error_jsonl)
+            if error_file_id:
+                download_file(error_file_id, error_jsonl)
                 logger.warning(f"Some errors occurred. Check {error_jsonl}")
 
             # Process results
-            process_results(input_csv, output_jsonl, output_csv, batches)
+            process_results(input_csv, output_jsonl, output_csv,
+                            *batch_info)
 
             # Update batch record with final output file
             update_batch_status(job_id, "completed", output_csv)
@@ -1840,20 +2348,159 @@ def run_translation_pipeline(input_csv, target_language, output_csv):
                 f"\n[+] Pipeline complete! Final translations in: {output_csv}"
             )
             logger.info("=== TRANSLATION PIPELINE COMPLETED SUCCESSFULLY ===")
-        else:
-            logger.error("Failed to download results")
-            update_batch_status(job_id, "download_failed")
+            return "completed"
+
+        logger.error("Failed to download results")
+        update_batch_status(job_id, "download_failed")
+        return "download_failed"
     elif job.status == "failed":
         logger.error("Job failed!")
         update_batch_status(job_id, "failed")
-        if hasattr(job, 'error_file_id') and job.error_file_id:
-            download_file(job.error_file_id, error_jsonl)
+        if error_file_id:
+            download_file(error_file_id, error_jsonl)
             logger.error(f"Check {error_jsonl} for details")
         logger.error("=== TRANSLATION PIPELINE FAILED ===")
-    else:
-        logger.error(f"Unexpected job status: {job.status}")
-        update_batch_status(job_id, f"unknown_{job.status}")
-        logger.error("=== TRANSLATION PIPELINE ENDED WITH UNKNOWN STATUS ===")
+        return "failed"
+
+    logger.error(f"Unexpected job status: {job.status}")
+    update_batch_status(job_id, f"unknown_{job.status}")
+    logger.error("=== TRANSLATION PIPELINE ENDED WITH UNKNOWN STATUS ===")
+    return f"unknown_{job.status}"
+
+
+def run_translation_pipeline(input_csv,
+                             target_language,
+                             output_csv,
+                             own_log=True):
+    """Execute the full translation pipeline and return (status, job_id).
+
+    With own_log=False the caller has already set up logging, as
+    batch_auto_translate.py does to translate several files in one process.
+    """
+    # Create unique file names based on input file
+    input_stem = Path(input_csv).stem
+    timestamp = int(time.time())
+    unique_id = f"{input_stem}_{timestamp}"
+
+    # Initialize logging
+    log_path = None
+    if own_log:
+        log_path = setup_logging(f"translation_log_{unique_id}.txt")
+
+    logger.info("=== TRANSLATION PIPELINE STARTED ===")
+    logger.info(f"Input CSV: {input_csv}")
+    logger.info(f"Target Language: {target_language}")
+    logger.info(f"Output CSV: {output_csv}")
+    logger.info(f"Unique ID: {unique_id}")
+    if log_path:
+        logger.info(f"Log file: {log_path}")
+
+    # Initialize batch tracking
+    initialize_batch_tracking()
+
+    return translate_language(input_csv, target_language, output_csv,
+                              unique_id, timestamp)
+
+
+def _start_language_job(input_csv, target_language, output_csv, unique_id,
+                        timestamp):
+    """Start one target language, logging instead of raising errors."""
+    threading.current_thread().name = target_language
+    try:
+        return start_language_job(input_csv, target_language, output_csv,
+                                  unique_id, timestamp)
+    except Exception as e:
+        logger.error(f"Translation to {target_language} failed: {e}")
+        return "error", None, None, None
+
+
+def _finish_language_job(job, input_csv, target_language, output_csv,
+                         unique_id, batch_info):
+    """Process one finished batch job, logging instead of raising errors."""
+    threading.current_thread().name = target_language
+    try:
+        return finish_translation_job(job, input_csv, output_csv, unique_id,
+                                      batch_info)
+    except Exception as e:
+        logger.error(f"Translation to {target_language} failed: {e}")
+        return "error"
+
+
+def run_multi_language_pipeline(input_csv,
+                                target_languages,
+                                output_csv,
+                                max_workers=MAX_CONCURRENT_JOBS):
+    """Translate one CSV into several languages with overlapping batch jobs.
+
+    Each language gets its own batch job and output file named
+    <output_stem>_<language><suffix>. All jobs are submitted up front and
+    awaited by a single polling loop, so their batch windows overlap instead
+    of running back to back; max_workers bounds how many languages are
+    prepared or processed at the same time.
+    """
+    input_stem = Path(input_csv).stem
+    timestamp = int(time.time())
+    output_path = Path(output_csv)
+
+    log_filename = f"translation_log_{input_stem}_multi_{timestamp}.txt"
+    log_path = setup_logging(log_filename, thread_names=True)
+
+    logger.info("=== MULTI-LANGUAGE TRANSLATION PIPELINE STARTED ===")
+    logger.info(f"Input CSV: {input_csv}")
+    logger.info(f"Target Languages: {', '.join(target_languages)}")
+    logger.info(f"Concurrent workers: {max_workers}")
+    logger.info(f"Log file: {log_path}")
+
+    initialize_batch_tracking()
+
+    jobs = {}
+    for language in target_languages:
+        language_output = str(
+            output_path.with_name(
+                f"{output_path.stem}_{language}{output_path.suffix}"))
+        jobs[language] = (language_output,
+                          f"{input_stem}_{language}_{timestamp}")
+
+    statuses = {}
+    submitted = {}  # Batch job ID -> (language, batch_info)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_language = {
+            executor.submit(_start_language_job, input_csv, language, language_output, unique_id, timestamp):
+            language
+            for language, (language_output, unique_id) in jobs.items()
+        }
+        for future in as_completed(future_to_language):
+            language = future_to_language[future]
+            status, _, job, batch_info = future.result()
+            if job is None:
+                statuses[language] = status
+            else:
+                submitted[job.id] = (language, batch_info)
+
+        # Wait for every batch job in one loop, processing each as it ends
+        future_to_language = {}
+        if submitted:
+            logger.info("\n=== Step 3: Waiting for job completion ===")
+            try:
+                for job in poll_jobs_until_done(submitted):
+                    language, batch_info = submitted[job.id]
+                    future = executor.submit(_finish_language_job, job,
+                                             input_csv, language,
+                                             *jobs[language], batch_info)
+                    future_to_language[future] = language
+            except Exception as e:
+                logger.error(f"Polling batch jobs failed: {e}")
+        for future in as_completed(future_to_language):
+            statuses[future_to_language[future]] = future.result()
+
+    for language, _ in submitted.values():
+        statuses.setdefault(language, "error")
+
+    logger.info("\n=== MULTI-LANGUAGE SUMMARY ===")
+    for language in target_languages:
+        logger.info(
+            f"{language}: {statuses[language]} -> {jobs[language][0]}")
+    return statuses
 
 
 if __name__ == "__main__":
@@ -6,108 +6,67 @@ Processes multiple CSV files automatically using auto_translate.py
 
 import os
 import sys
-import subprocess
 import time
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
-import csv
-import re
 
-
-def save_batch_job_tracking(batch_id, input_file, job_id, target_language,
-                            output_file):
-    """Save batch job tracking information to a CSV file."""
-    tracking_file = "batch_job_tracking.csv"
-    timestamp = int(time.time())
-
-    # Check if tracking file exists
-    file_exists = os.path.exists(tracking_file)
-
-    with open(tracking_file, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-
-        # Write header if file doesn't exist
-        if not file_exists:
-            writer.writerow([
-                "batch_id", "input_file", "job_id", "status", "timestamp",
-                "target_language", "output_file"
-            ])
-
-        # Write job tracking info
-        writer.writerow([
-            batch_id, input_file, job_id, "submitted", timestamp,
-            target_language, output_file
-        ])
+from batch_tracking import (add_batch_record, list_batch_records,
+                            initialize_batch_tracking, BATCH_TRACKING_DB,
+                            BATCH_TRACKING_FILE)
 
 
-def update_batch_job_status(job_id, status):
-    """Update job status in batch tracking file."""
-    tracking_file = "batch_job_tracking.csv"
-
-    if not os.path.exists(tracking_file):
-        return
-
-    # Read existing data
-    rows = []
-    with open(tracking_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)
-        rows.append(header)
-
-        for row in reader:
-            if row[2] == job_id:  # job_id column
-                row[3] = status  # status column
-            rows.append(row)
-
-    # Write back updated data
-    with open(tracking_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerows(rows)
+def save_batch_job_tracking(batch_id, input_file, job_id, status,
+                            target_language, output_file):
+    """Record a file's job under the folder batch in the tracking database."""
+    timestamp = int(time.time())
+    add_batch_record(batch_id, input_file, job_id, status, timestamp,
+                     target_language, output_file)
 
 
 def view_batch_job_tracking():
     """Display batch job tracking information."""
-    tracking_file = "batch_job_tracking.csv"
-
-    if not os.path.exists(tracking_file):
-        print("No batch job tracking file found.")
-        return
+    # Build the database from a legacy tracking CSV, as batch_tracker.py does
+    if not os.path.exists(BATCH_TRACKING_DB):
+        if not os.path.exists(BATCH_TRACKING_FILE):
+            print("No batch job tracking database found.")
+            return
+        initialize_batch_tracking()
 
     print("\n" + "=" * 100)
     print("BATCH JOB TRACKING INFORMATION")
     print("=" * 100)
 
-    with open(tracking_file, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        header = next(reader)
+    # Print header
+    print(
+        f"{'Batch ID':<20} {'Input File':<25} {'Job ID':<20} {'Status':<12} {'Language':<10} {'Output File':<25}"
+    )
+    print("-" * 112)
+
+    # Print each job
+    for record in list_batch_records():
+        batch_id = record['batch_id'] or "N/A"
+        input_file = os.path.basename(
+            record['input_file']) if record['input_file'] else "N/A"
+        job_id = record['job_id'] or "N/A"
+        status = record['status'] or "N/A"
+        language = record['target_language'] or "N/A"
+        output_file = os.path.basename(
+            record['output_file']) if record['output_file'] else "N/A"
 
-        # Print header
         print(
-            f"{'Batch ID':<20} {'Input File':<25} {'Job ID':<20} {'Status':<12} {'Language':<10} {'Output File':<25}"
+            f"{batch_id:<20} {input_file:<25} {job_id:<20} {status:<12} {language:<10} {output_file:<25}"
         )
-        print("-" * 112)
-
-        # Print each job
-        for row in reader:
-            if len(row) >= 7:
-                batch_id = row[0] if row[0] else "N/A"
-                input_file = os.path.basename(row[1]) if row[1] else "N/A"
-                job_id = row[2] if row[2] else "N/A"
-                status = row[3] if row[3] else "N/A"
-                language = row[5] if row[5] else "N/A"
-                output_file = os.path.basename(row[6]) if row[6] else "N/A"
-
-                print(
-                    f"{batch_id:<20} {input_file:<25} {job_id:<20} {status:<12} {language:<10} {output_file:<25}"
-                )
 
     print("=" * 100)
 
 
 def run_single_translation(input_csv, target_language, output_dir, batch_id):
-    """Run auto_translate.py for a single CSV file with batch tracking."""
+    """Run the translation pipeline for a single CSV file with batch tracking."""
+    job_id = "unknown"
     try:
+        from auto_translate import run_translation_pipeline
+
         # Create output filename based on input
         input_stem = Path(input_csv).stem
         output_csv = os.path.join(output_dir, f"{input_stem}_translated.csv")
@@ -117,67 +76,39 @@ def run_single_translation(input_csv, target_language, output_dir, batch_id):
         print(f"Output: {output_csv}")
         print(f"{'='*60}")
 
-        # Run auto_translate.py
-        cmd = [
-            sys.executable, "auto_translate.py", input_csv, target_language,
-            output_csv
-        ]
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=7200  # 2 hour timeout per file
-        )
-
-        # Extract job ID from the output (look for "Job ID: batch_xxxxx")
-        job_id = "unknown"
-        if result.stdout:
-            import re
-            job_match = re.search(r'Job ID: (batch_[a-zA-Z0-9]+)',
-                                  result.stdout)
-            if job_match:
-                job_id = job_match.group(1)
-
-        # Save batch job tracking
-        save_batch_job_tracking(batch_id, input_csv, job_id, target_language,
-                                output_csv)
-
-        if result.returncode == 0:
+        # Files run in this process; tag their log lines with the file name
+        threading.current_thread().name = input_stem
+        status, pipeline_job_id = run_translation_pipeline(input_csv,
+                                                           target_language,
+                                                           output_csv,
+                                                           own_log=False)
+        # The pipeline tracks its own job; file it under this folder batch
+        if pipeline_job_id:
+            job_id = pipeline_job_id
+            save_batch_job_tracking(batch_id, input_csv, job_id, status,
+                                    target_language, output_csv)
+
+        if status == "completed":
             print(f"✅ SUCCESS: {input_csv} -> {output_csv}")
-            update_batch_job_status(job_id, "completed")
             return {
                 'file': input_csv,
                 'status': 'success',
                 'output': output_csv,
-                'job_id': job_id,
-                'stdout': result.stdout,
-                'stderr': result.stderr
+                'job_id': job_id
             }
         else:
+            error = f"Translation finished with status: {status}"
             print(f"❌ FAILED: {input_csv}")
-            print(f"Error: {result.stderr}")
-            update_batch_job_status(job_id, "failed")
+            print(f"Error: {error}")
             return {
                 'file': input_csv,
                 'status': 'failed',
-                'error': result.stderr,
-                'job_id': job_id,
-                'stdout': result.stdout
+                'error': error,
+                'job_id': job_id
             }
 
-    except subprocess.TimeoutExpired:
-        print(f"⏰ TIMEOUT: {input_csv} (took longer than 2 hours)")
-        update_batch_job_status(job_id, "timeout")
-        return {
-            'file': input_csv,
-            'status': 'timeout',
-            'error': 'Process timed out after 2 hours',
-            'job_id': job_id
-        }
     except Exception as e:
         print(f"💥 ERROR: {input_csv} - {str(e)}")
-        update_batch_job_status(job_id, "error")
         return {
             'file': input_csv,
             'status': 'error',
@@ -191,6 +122,8 @@ def process_folder(input_folder,
                    output_folder,
                    max_workers=3):
     """Process all CSV files in a folder with batch tracking."""
+    # Imported here so --tracking works without an OpenAI API key
+    from auto_translate import setup_logging
 
     # Create output directory
     os.makedirs(output_folder, exist_ok=True)
@@ -213,6 +146,11 @@ def process_folder(input_folder,
     for csv_file in csv_files:
         print(f"  - {os.path.basename(csv_file)}")
 
+    # All files share one pipeline log, tagged per file
+    log_path = setup_logging(f"translation_log_{batch_id}.txt",
+                             thread_names=True)
+    print(f"Pipeline log: {log_path}")
+
     # Process files with threading
     results = []
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -279,7 +217,7 @@ def process_folder(input_folder,
 
     print(f"\nDetailed log saved to: {log_file}")
     print(f"All outputs saved to: {output_folder}")
-    print(f"Batch job tracking saved to: batch_job_tracking.csv")
+    print(f"Batch job tracking saved to: {BATCH_TRACKING_DB}")
 
 
 def main():
@@ -5,10 +5,12 @@ Provides commands to view and manage batch job tracking records.
 """
 
 import sys
-import csv
+import logging
 from pathlib import Path
 from datetime import datetime
-from auto_translate import list_batch_records, get_batch_record, BATCH_TRACKING_FILE
+from batch_tracking import (list_batch_records, get_batch_record,
+                            export_batch_records, initialize_batch_tracking,
+                            BATCH_TRACKING_DB, BATCH_TRACKING_FILE)
 
 
 def print_table(records, headers):
@@ -157,6 +159,9 @@ def main():
         print(
             "  python batch_tracker.py summary                 # Show summary statistics"
         )
+        print(
+            "  python batch_tracker.py export [file.csv]       # Export records to CSV"
+        )
         print("\nExamples:")
         print("  python batch_tracker.py list")
         print("  python batch_tracker.py status completed")
@@ -165,15 +170,23 @@ def main():
             "  python batch_tracker.py details batch_6892e935932c819090e1be3f2891e6a3"
         )
         print("  python batch_tracker.py summary")
+        print("  python batch_tracker.py export report.csv")
         return
 
     command = sys.argv[1].lower()
 
-    # Check if tracking file exists
-    if not Path(BATCH_TRACKING_FILE).exists():
-        print(f"No batch tracking file found: {BATCH_TRACKING_FILE}")
-        print("Run a translation job first to create the tracking file.")
-        return
+    # Show tracking messages as plain output lines
+    logging.basicConfig(level=logging.INFO,
+                        format='%(message)s',
+                        stream=sys.stdout)
+
+    # Check if tracking database exists (or can be built from a legacy CSV)
+    if not Path(BATCH_TRACKING_DB).exists():
+        if not Path(BATCH_TRACKING_FILE).exists():
+            print(f"No batch tracking database found: {BATCH_TRACKING_DB}")
+            print("Run a translation job first to create the tracking database.")
+            return
+        initialize_batch_tracking()
 
     if command == "list":
         list_all_batches()
@@ -191,6 +204,10 @@ def main():
         show_batch_details(job_id)
     elif command == "summary":
         show_summary()
+    elif command == "export":
+        csv_path = sys.argv[2] if len(sys.argv) > 2 else BATCH_TRACKING_FILE
+        count = export_batch_records(csv_path)
+        print(f"Exported {count} batch records to {csv_path}")
     else:
         print(f"Unknown command: {command}")
         print("Use 'python batch_tracker.py' to see available commands.")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Batch Job Tracking Store
+Keeps one SQLite record per translation job for the pipeline and the
+tracking tools; importing it needs no OpenAI API key.
+"""
+
+import atexit
+import csv
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+
+BATCH_TRACKING_DB = "batch_job_tracking.db"
+BATCH_TRACKING_FILE = "batch_job_tracking.csv"  # Legacy store / CSV export
+BATCH_TRACKING_COLUMNS = ('batch_id', 'input_file', 'job_id', 'status',
+                          'timestamp', 'target_language', 'output_file')
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Serializes tracking-database access from concurrent language jobs
+_tracking_lock = threading.RLock()
+_tracking_conn = None  # Opened once by _tracking_db() and closed at exit
+
+
+def _tracking_db():
+    """Return the shared tracking database connection, opening it on first use.
+
+    Callers must hold _tracking_lock.
+    """
+    global _tracking_conn
+    if _tracking_conn is None:
+        _tracking_conn = sqlite3.connect(BATCH_TRACKING_DB,
+                                         check_same_thread=False)
+        _tracking_conn.row_factory = sqlite3.Row
+        # WAL commits append to a log instead of syncing the database file
+        _tracking_conn.execute("PRAGMA journal_mode=WAL")
+        _tracking_conn.execute("PRAGMA synchronous=NORMAL")
+        atexit.register(_tracking_conn.close)
+    return _tracking_conn
+
+
+def _import_tracking_csv(conn):
+    """Copy records from the legacy tracking CSV into a new database."""
+    with open(BATCH_TRACKING_FILE, 'r', encoding='utf-8') as f:
+        rows = [
+            tuple(row.get(column) or "" for column in BATCH_TRACKING_COLUMNS)
+            for row in csv.DictReader(f)
+        ]
+    conn.executemany(
+        "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+def initialize_batch_tracking():
+    """Create the batch tracking database if it doesn't exist.
+
+    Records from an existing tracking CSV are imported the first time.
+    """
+    if Path(BATCH_TRACKING_DB).exists():
+        logger.info(
+            f"Using existing batch tracking database: {BATCH_TRACKING_DB}")
+        return
+
+    with _tracking_lock, _tracking_db() as conn:
+        conn.execute("""CREATE TABLE IF NOT EXISTS batches (
+                batch_id TEXT,
+                input_file TEXT,
+                job_id TEXT PRIMARY KEY,
+                status TEXT,
+                timestamp INTEGER,
+                target_language TEXT,
+                output_file TEXT)""")
+        imported = 0
+        if Path(BATCH_TRACKING_FILE).exists():
+            imported = _import_tracking_csv(conn)
+
+    message = f"Created new batch tracking database: {BATCH_TRACKING_DB}"
+    if imported:
+        message += f" ({imported} records imported from {BATCH_TRACKING_FILE})"
+    logger.info(message)
+
+
+def add_batch_record(batch_id,
+                     input_file,
+                     job_id,
+                     status,
+                     timestamp,
+                     target_language,
+                     output_file=None):
+    """Add a new batch record to the tracking database."""
+    with _tracking_lock:
+        # Ensure the database exists
+        initialize_batch_tracking()
+
+        with _tracking_db() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (batch_id, input_file, job_id, status, timestamp,
+                 target_language, output_file or ""))
+
+    logger.info(f"Added batch record: {batch_id} -> {job_id} ({status})")
+
+
+def update_batch_status(job_id, new_status, output_file=None):
+    """Update the status of an existing batch record."""
+    if not Path(BATCH_TRACKING_DB).exists():
+        logger.warning(
+            f"Batch tracking database does not exist: {BATCH_TRACKING_DB}"
+        )
+        return False
+
+    with _tracking_lock, _tracking_db() as conn:
+        cursor = conn.execute(
+            "UPDATE batches SET status = ?, "
+            "output_file = COALESCE(NULLIF(?, ''), output_file) "
+            "WHERE job_id = ?", (new_status, output_file, job_id))
+        updated = cursor.rowcount > 0
+
+    if updated:
+        logger.info(f"Updated batch record: {job_id} -> {new_status}")
+        return True
+
+    logger.warning(f"Job ID not found in tracking database: {job_id}")
+    return False
+
+
+def get_batch_record(job_id):
+    """Get a batch record by job_id."""
+    if not Path(BATCH_TRACKING_DB).exists():
+        return None
+
+    with _tracking_lock:
+        row = _tracking_db().execute("SELECT * FROM batches WHERE job_id = ?",
+                           (job_id, )).fetchone()
+    return dict(row) if row else None
+
+
+def list_batch_records(status_filter=None):
+    """List all batch records, optionally filtered by status."""
+    if not Path(BATCH_TRACKING_DB).exists():
+        logger.info("No batch tracking database found")
+        return []
+
+    with _tracking_lock:
+        conn = _tracking_db()
+        if status_filter is None:
+            rows = conn.execute("SELECT * FROM batches ORDER BY rowid")
+        else:
+            rows = conn.execute(
+                "SELECT * FROM batches WHERE status = ? ORDER BY rowid",
+                (status_filter, ))
+        return [dict(row) for row in rows]
+
+
+def export_batch_records(csv_path=BATCH_TRACKING_FILE):
+    """Write all batch records to a CSV report and return the record count."""
+    records = list_batch_records()
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=BATCH_TRACKING_COLUMNS)
+        writer.writeheader()
+        writer.writerows(records)
+    return len(records)
@@ -60,6 +60,7 @@ fi
 
 # Reset batch tracking
 echo "Resetting batch tracking..."
+rm -f batch_job_tracking.db batch_job_tracking.db-wal batch_job_tracking.db-shm
 if [ -f "batch_job_tracking.csv" ]; then
     echo "batch_id,input_file,job_id,status,timestamp,target_language,output_file" > batch_job_tracking.csv
 fi
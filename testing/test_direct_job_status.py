@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test the status recorded for direct-mode jobs when requests fail
+"""
+
+import csv
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+import auto_translate
+import batch_tracking
+from auto_translate import create_jsonl_from_csv, run_direct_job
+from batch_tracking import get_batch_record
+
+
+class StubCompletions:
+    """Translate every batch, failing the ones that contain fail_id"""
+
+    def __init__(self, fail_id=None):
+        self.fail_id = fail_id
+
+    def create(self, **body):
+        batch = json.loads(body["messages"][1]["content"])
+        if self.fail_id == "all" or self.fail_id in batch:
+            raise ValueError("stubbed request failure")
+        content = json.dumps({k: f"TR {v}" for k, v in batch.items()},
+                             ensure_ascii=False)
+        return SimpleNamespace(model_dump=lambda **kwargs: {
+            "choices": [{
+                "message": {
+                    "content": content
+                }
+            }]
+        })
+
+
+def run_with_stub(fail_id, name):
+    """Run one direct job against the stub and return (status, record)"""
+    auto_translate.direct_client = SimpleNamespace(chat=SimpleNamespace(
+        completions=StubCompletions(fail_id)))
+    batch_info = create_jsonl_from_csv("input.csv", f"{name}_batch.jsonl",
+                                       "Telugu")
+    assert len(batch_info[0]) > 1, "test input should span several batches"
+    status, job_id = run_direct_job(f"{name}_batch.jsonl", "input.csv",
+                                    "Telugu", f"{name}.csv", name, 0,
+                                    batch_info)
+    return status, get_batch_record(job_id)
+
+
+def test_direct_job_status():
+    """All-failed, partial and completed direct jobs are tracked as such"""
+
+    test_data = [(str(i), f"Sensor circuit {i} voltage below threshold")
+                 for i in range(1, 41)]
+
+    old_client = auto_translate.direct_client
+    old_token_limit = auto_translate.MODEL_TOKEN_LIMIT
+    old_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        # Small batches so one failing request leaves the others
+        auto_translate.MODEL_TOKEN_LIMIT = 300
+        try:
+            with open("input.csv", "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["description_id", "english_sentence"])
+                writer.writerows(test_data)
+
+            results = {
+                "failed": run_with_stub("all", "all_failed"),
+                "partial": run_with_stub("1", "partial"),
+                "completed": run_with_stub(None, "completed"),
+            }
+        finally:
+            auto_translate.direct_client = old_client
+            auto_translate.MODEL_TOKEN_LIMIT = old_token_limit
+            with batch_tracking._tracking_lock:
+                if batch_tracking._tracking_conn is not None:
+                    batch_tracking._tracking_conn.close()
+                    batch_tracking._tracking_conn = None
+            os.chdir(old_dir)
+
+    for expected, (status, record) in results.items():
+        print(f"  {expected}: returned {status}, tracked {record['status']}")
+        assert status == expected
+        assert record["status"] == expected
+    print("Direct job statuses match the failed requests")
+
+
+if __name__ == "__main__":
+    test_direct_job_status()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test that repeated sentences keep the final CSV in input order
+"""
+
+import csv
+import json
+import os
+import tempfile
+from auto_translate import create_jsonl_from_csv, process_results
+
+
+def test_duplicate_order():
+    """Rows that repeat a sentence are written at their input position"""
+
+    # Test data: rows 3, 5 and 6 repeat earlier sentences
+    test_data = [
+        ("1", "Check engine coolant level"),
+        ("2", "Replace faulty sensor"),
+        ("3", "Check engine coolant level"),
+        ("4", "Inspect brake system"),
+        ("5", "Replace faulty sensor"),
+        ("6", "Check engine coolant level"),
+        ("7", "Ignition Run/Act Circuit Open"),
+    ]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        old_dir = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            with open("input.csv", "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["description_id", "english_sentence"])
+                writer.writerows(test_data)
+
+            batch_info = create_jsonl_from_csv("input.csv", "batch.jsonl",
+                                               "Telugu")
+
+            # Fake batch output: translate every submitted sentence
+            with open("batch.jsonl", encoding="utf-8") as f_in, \
+                 open("output.jsonl", "w", encoding="utf-8") as f_out:
+                for line in f_in:
+                    request = json.loads(line)
+                    batch = json.loads(request["body"]["messages"][1]["content"])
+                    content = json.dumps(
+                        {k: f"TR {v}" for k, v in batch.items()},
+                        ensure_ascii=False)
+                    f_out.write(
+                        json.dumps({
+                            "custom_id": request["custom_id"],
+                            "response": {
+                                "status_code": 200,
+                                "body": {
+                                    "choices": [{
+                                        "message": {
+                                            "content": content
+                                        }
+                                    }]
+                                }
+                            }
+                        }) + "\n")
+
+            process_results("input.csv", "output.jsonl", "final.csv",
+                            *batch_info)
+
+            with open("final.csv", encoding="utf-8-sig") as f:
+                rows = list(csv.reader(f))[1:]
+        finally:
+            os.chdir(old_dir)
+
+    print("=== FINAL CSV ===")
+    for row in rows:
+        print(f"  {row}")
+
+    assert [row[0] for row in rows] == [did for did, _ in test_data]
+    assert [row[2] for row in rows] == [f"TR {s}" for _, s in test_data]
+    print("Output order matches input order")
+
+
+if __name__ == "__main__":
+    test_duplicate_order()